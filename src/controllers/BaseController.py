@@ -1,4 +1,5 @@
 """Base controller class for application controllers"""
+import functools
 import os
 import random
 import string
@@ -22,16 +23,46 @@ from src.utils.config import Config
 #       - Cloud database credentials and security best practices
 #       - Backup and disaster recovery strategies
 
+# Path layout is fixed for the process lifetime, so resolve it once at import
+# time instead of re-running abspath/dirname per instance. _BASE_DIR is already
+# absolute, so the joins below need no further abspath normalization.
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_FILES_DIR = os.path.join(_BASE_DIR, "data", "topics")
+_DATABASE_DIR = os.path.join(_BASE_DIR, "data", "database")
+
+# Alphabet for random identifiers, built once instead of per call
+_ALPHABET = string.ascii_lowercase + string.digits
+
+
 class BaseController:
     """Base controller class with common functionality"""
-    
+
+    # Directories already created by any controller instance in this process.
+    # Shared across instances so hot paths skip the makedirs stat probe after
+    # the first access.
+    _ensured_dirs: set[str] = set()
+
     def __init__(self):
         """Initialize base controller with app settings"""
         self.app_settings: Config = get_settings()
-        self._base_dir: str | None = None
-        self._files_dir: str | None = None
         self._database_dir: str | None = None
-    
+
+    @classmethod
+    def _ensure_dir(cls, path: str) -> str:
+        """
+        Create a directory once per process, skipping the syscall on repeat calls.
+
+        Args:
+            path: Directory path to create if not already ensured
+
+        Returns:
+            The same path, for chaining
+        """
+        if path not in cls._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            cls._ensured_dirs.add(path)
+        return path
+
     @property
     def base_dir(self) -> str:
         """
@@ -40,40 +71,31 @@ class BaseController:
         Returns:
             Absolute path to base directory
         """
-        if self._base_dir is None:
-            # Get the directory where this file is located (controllers/)
-            controllers_dir = os.path.dirname(os.path.abspath(__file__))
-            # Parent directory is the base (src/)
-            self._base_dir = os.path.dirname(controllers_dir)
-        return self._base_dir
+        return _BASE_DIR
     
     @property
     def files_dir(self) -> str:
         """
         Get base file storage directory at {base_dir}/data/topics.
-        
+
         Returns:
-            Absolute path to topics directory (created if doesn't exist)
+            Absolute path to topics directory. Not created here: the per-topic
+            helpers create the deepest path in one makedirs call, which builds
+            the intermediate parents as a side effect.
         """
-        if self._files_dir is None:
-            files_path = os.path.join(self.base_dir, "data", "topics")
-            os.makedirs(files_path, exist_ok=True)
-            self._files_dir = os.path.abspath(files_path)
-        return self._files_dir
-    
+        return _FILES_DIR
+
     def get_topic_files_dir(self, topic_name: str) -> str:
         """
         Get file storage directory for a specific topic at {base_dir}/data/topics/{topic_name}/files.
-        
+
         Args:
             topic_name: Name of the topic (used as directory name)
-        
+
         Returns:
             Absolute path to topic's files directory (created if doesn't exist)
         """
-        topic_files_path = os.path.join(self.files_dir, topic_name, "files")
-        os.makedirs(topic_files_path, exist_ok=True)
-        return os.path.abspath(topic_files_path)
+        return _topic_files_dir(self.files_dir, topic_name)
     
     @property
     def database_dir(self) -> str:
@@ -84,9 +106,7 @@ class BaseController:
             Absolute path to database directory (created if doesn't exist)
         """
         if self._database_dir is None:
-            db_path = os.path.join(self.base_dir, "data", "database")
-            os.makedirs(db_path, exist_ok=True)
-            self._database_dir = os.path.abspath(db_path)
+            self._database_dir = self._ensure_dir(_DATABASE_DIR)
         return self._database_dir
     
     def generate_random_string(self, length: int = 12) -> str:
@@ -99,8 +119,9 @@ class BaseController:
         Returns:
             Random alphanumeric string
         """
-        characters = string.ascii_lowercase + string.digits
-        return ''.join(random.choice(characters) for _ in range(length))
+        # random.choices runs the sampling loop in C, avoiding one Python-level
+        # random.choice call per character
+        return ''.join(random.choices(_ALPHABET, k=length))
     
     def get_database_path(self, db_name: str) -> str:
         """
@@ -112,6 +133,14 @@ class BaseController:
         Returns:
             Absolute path to the database directory
         """
+        # database_dir is already absolute, so the join needs no abspath pass
         db_path = os.path.join(self.database_dir, db_name)
-        os.makedirs(db_path, exist_ok=True)
-        return os.path.abspath(db_path)
+        return self._ensure_dir(db_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _topic_files_dir(files_dir: str, topic_name: str) -> str:
+    """Resolve (and create once) the per-topic files directory."""
+    # files_dir is already absolute, so the join needs no abspath pass
+    topic_files_path = os.path.join(files_dir, topic_name, "files")
+    return BaseController._ensure_dir(topic_files_path)
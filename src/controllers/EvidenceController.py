@@ -1,18 +1,46 @@
 """Evidence controller for vector database operations and evidence retrieval"""
-import json
+import asyncio
+import functools
+import logging
 import time
+from array import array
+from collections import OrderedDict
 from typing import Union, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, is_dataclass, asdict
 
 from src.controllers.BaseController import BaseController
 from src.models.db_schemas.citatum.schemas.topic import Topic
 from src.models.db_schemas.citatum.schemas.chunk import Chunk
+from src.utils.embedding_cache import get_embedding_cache
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+def _to_jsonable(obj: Any) -> Any:
+    """
+    Recursively convert an object into JSON-serializable primitives.
+
+    Walks the structure directly instead of a json.dumps/json.loads round-trip,
+    which would serialize to a string and re-parse it just to strip
+    non-serializable attributes.
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _to_jsonable(asdict(obj))
+    if isinstance(obj, dict):
+        return {str(k): _to_jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_to_jsonable(item) for item in obj]
+    if hasattr(obj, '__dict__'):
+        return _to_jsonable(vars(obj))
+    return str(obj)
+
+
+# slots=True drops the per-instance __dict__; with up to limit instances built
+# per search call this shrinks each result to its three fields
+@dataclass(slots=True)
 class RetrievedDocument:
     """Represents a retrieved document from vector search"""
     text: str
@@ -20,20 +48,203 @@ class RetrievedDocument:
     score: float = 0.0
 
 
+# Translation table for collection-name sanitization: one C-level pass
+# replaces the chain of str.replace calls
+_SANITIZE_TABLE = str.maketrans({'/': '_', '\\': '_', ' ': '_'})
+
+
+@functools.lru_cache(maxsize=256)
+def _collection_name(vector_size: int, topic_name: str) -> str:
+    """Build (and memoize) the collection name for a (vector_size, topic) pair."""
+    # Sanitize topic_name for use in collection name (replace special chars)
+    safe_topic_name = topic_name.translate(_SANITIZE_TABLE).replace("..", "_")
+    return f"pgvector_{vector_size}_{safe_topic_name}"
+
+
+def _attr_adapter(result: Any) -> RetrievedDocument:
+    """Convert an attribute-shaped search result into a RetrievedDocument."""
+    return RetrievedDocument(
+        text=result.text,
+        metadata=result.metadata if hasattr(result.metadata, '__dict__') else {},
+        score=getattr(result, 'score', 0.0)
+    )
+
+
+# Similarity score above which a search result counts as supporting evidence
+_SUPPORT_SCORE_THRESHOLD = 0.5
+
+
+def _to_evidence_dict(result: RetrievedDocument) -> dict:
+    """Format a retrieved document as an evidence dict for claim verification."""
+    # Metadata keys are normalized at ingest, so a single lookup per field
+    # suffices; pre-bind .get to skip one attribute lookup per key
+    get = result.metadata.get
+    return {
+        "chunk_text": result.text,
+        "chunk_id": get('chunk_id'),
+        "document": get('document', {}),
+        "page_number": get('page_number'),
+        "section": get('section'),
+        "similarity_score": result.score
+    }
+
+
+def _quantize_int8(embeddings: List[list]) -> Tuple[List[list], float]:
+    """
+    Symmetric int8 quantization of a batch of embedding vectors.
+
+    Returns (quantized vectors, scale) where original ~= quantized * scale.
+    With cosine distance the uniform scale cancels out, so search ranking is
+    preserved while the wire payload shrinks roughly 4x.
+    """
+    max_abs = max((abs(v) for vec in embeddings for v in vec), default=0.0)
+    if max_abs == 0.0:
+        return [[0] * len(vec) for vec in embeddings], 1.0
+    scale = max_abs / 127.0
+    inv_scale = 1.0 / scale
+    return [[round(v * inv_scale) for v in vec] for vec in embeddings], scale
+
+
+def _to_retrieved_documents(results: List[Any]) -> List[RetrievedDocument]:
+    """
+    Convert raw search results to RetrievedDocument objects.
+
+    Both shipped providers return the canonical dict shape, so the common case
+    is a straight list comprehension with no per-element dispatch or exception
+    machinery; non-dict (legacy) results fall back to attribute adaption.
+    """
+    if isinstance(results[0], dict):
+        return [
+            RetrievedDocument(
+                text=r.get('text', ''),
+                metadata=r.get('metadata', {}),
+                score=r.get('score', 0.0)
+            )
+            for r in results
+        ]
+    return [_attr_adapter(r) for r in results]
+
+
+def _partition_evidence(
+    search_results: List[RetrievedDocument]
+) -> Tuple[List[dict], List[dict]]:
+    """
+    Split search results into (supporting, refuting) evidence dicts.
+
+    Results partition in one tight pass: pre-bound appends keep the per-result
+    work to a dict build plus one comparison.
+    """
+    supporting_evidence: List[dict] = []
+    refuting_evidence: List[dict] = []
+    append_supporting = supporting_evidence.append
+    append_refuting = refuting_evidence.append
+    for result in search_results:
+        # For now, evidence above the threshold is considered supporting
+        # In the future, this could be classified with dedicated logic
+        if result.score > _SUPPORT_SCORE_THRESHOLD:
+            append_supporting(_to_evidence_dict(result))
+        else:
+            append_refuting(_to_evidence_dict(result))
+    return supporting_evidence, refuting_evidence
+
+
+# Process-wide LRU cache of query embeddings keyed on
+# (model_id, document_type, text). Module-level so the cache survives the
+# per-request EvidenceController instances the routes construct.
+_QUERY_EMBEDDING_CACHE: OrderedDict = OrderedDict()
+_QUERY_CACHE_MAXSIZE = 4096
+
+
 class EvidenceController(BaseController):
     """Controller for vector database operations and evidence retrieval"""
-    
-    def __init__(self, vectordb_client: Any, embedding_client: Any):
+
+    def __init__(
+        self,
+        vectordb_client: Any,
+        embedding_client: Any,
+        enable_quantization: bool = False
+    ):
         """
         Initialize EvidenceController with vector database and embedding clients.
-        
+
         Args:
             vectordb_client: Vector database client instance
             embedding_client: Embedding client instance
+            enable_quantization: Quantize embeddings to int8 before insertion
+                (requires a client with insert_many_int8; cosine ranking is
+                unaffected since the uniform scale cancels out)
         """
         super().__init__()
         self.vectordb_client = vectordb_client
         self.embedding_client = embedding_client
+        self.enable_quantization = enable_quantization
+        # Resolve the client's delete-by-IDs method once instead of probing
+        # with hasattr on every delete call; None if the client supports neither
+        self._delete_by_ids_fn = (
+            getattr(vectordb_client, 'delete_by_ids', None)
+            or getattr(vectordb_client, 'delete_many', None)
+        )
+        # Prefer a native async embedding entry point when the client offers
+        # one; otherwise run the synchronous embed_text on a worker thread so
+        # it never blocks the event loop. Resolved once here rather than per call.
+        aembed = getattr(embedding_client, 'aembed_text', None)
+        if aembed is not None:
+            self._embed_async = aembed
+        else:
+            self._embed_async = functools.partial(asyncio.to_thread, embedding_client.embed_text)
+        # Persistent content-hash cache so re-indexing unchanged chunks skips
+        # the embedding model entirely (no-op unless EMBEDDING_CACHE_URL is
+        # set). Shared per process: a per-controller cache would open a new
+        # Redis pool for every task and never close it.
+        self._embedding_cache = get_embedding_cache(self.app_settings.embedding_cache_url)
+
+    async def _embed_documents(self, batch_texts: List[str]) -> List[list]:
+        """
+        Embed document texts, reusing persisted vectors for unchanged content.
+
+        Looks the batch up in the content-hash cache, embeds only the misses,
+        stores the fresh vectors back, and returns the merged result aligned
+        with batch_texts.
+        """
+        model_id = self.embedding_client.embedding_model_id
+        vectors = await self._embedding_cache.get_many(model_id, batch_texts)
+        missing_idx = [i for i, v in enumerate(vectors) if v is None]
+        if not missing_idx:
+            return vectors
+
+        missing_texts = [batch_texts[i] for i in missing_idx]
+        fresh = await self._embed_async(text=missing_texts, document_type="document")
+        if not fresh or len(fresh) != len(missing_texts):
+            # Let the caller's validation report the mismatch
+            return fresh
+
+        for j, i in enumerate(missing_idx):
+            vectors[i] = fresh[j]
+        await self._embedding_cache.set_many(model_id, missing_texts, fresh)
+        return vectors
+
+    def _get_cached_query_embedding(self, text: str, document_type: str = "query") -> Optional[array]:
+        """Return cached query embedding for text (as a float32 array), or None on a cache miss."""
+        cache_key = (self.embedding_client.embedding_model_id, document_type, text)
+        query_vector = _QUERY_EMBEDDING_CACHE.get(cache_key)
+        if query_vector is not None:
+            _QUERY_EMBEDDING_CACHE.move_to_end(cache_key)
+        return query_vector
+
+    def _store_query_embedding(self, text: str, query_vector: list, document_type: str = "query") -> None:
+        """Store a query embedding, evicting the least recently used entry."""
+        cache_key = (self.embedding_client.embedding_model_id, document_type, text)
+        # Stored as a compact float32 array (4 bytes/component) rather than a
+        # list of boxed floats (~36 bytes/component); both providers only
+        # iterate the vector, so no conversion back is needed on hits
+        _QUERY_EMBEDDING_CACHE[cache_key] = array('f', query_vector)
+        if len(_QUERY_EMBEDDING_CACHE) > _QUERY_CACHE_MAXSIZE:
+            _QUERY_EMBEDDING_CACHE.popitem(last=False)
+
+    @staticmethod
+    def clear_query_cache() -> None:
+        """Drop all cached query embeddings (e.g. after an embedding model change)."""
+        _QUERY_EMBEDDING_CACHE.clear()
     
     def create_collection_name(self, topic_name: str) -> str:
         """
@@ -45,11 +256,9 @@ class EvidenceController(BaseController):
         Returns:
             Collection name in format: "pgvector_{vector_size}_{sanitized_topic_name}"
         """
-        vector_size = self.vectordb_client.default_vector_size
-        # Sanitize topic_name for use in collection name (replace special chars)
-        safe_topic_name = topic_name.replace("/", "_").replace("\\", "_").replace("..", "_").replace(" ", "_")
-        collection_name = f"pgvector_{vector_size}_{safe_topic_name}"
-        return collection_name.strip()
+        # Memoized - the same (vector_size, topic_name) pair is resolved on
+        # every vector-DB operation
+        return _collection_name(self.vectordb_client.default_vector_size, topic_name)
     
     async def reset_evidence_collection(self, topic: Topic) -> bool:
         """
@@ -82,45 +291,48 @@ class EvidenceController(BaseController):
         # Get collection name (use topic_name to match how collections are created)
         collection_name = self.create_collection_name(topic.topic_name)
         logger.info(
-            f"Retrieving collection info | collection={collection_name} | "
-            f"topic={topic.topic_name}"
+            "Retrieving collection info | collection=%s | topic=%s",
+            collection_name, topic.topic_name
         )
         
-        info_start = time.time()
+        info_start = time.perf_counter_ns()
         try:
             # Get collection info from vector database
             collection_info = await self.vectordb_client.get_collection_info(collection_name)
-            info_time = time.time() - info_start
+            info_time = (time.perf_counter_ns() - info_start) / 1e9
             
             exists = collection_info.get('exists', False)
             row_count = collection_info.get('row_count', 0)
             
             logger.info(
-                f"Collection info retrieved | collection={collection_name} | "
-                f"topic={topic.topic_name} | exists={exists} | row_count={row_count} | "
-                f"duration={info_time:.3f}s"
+                "Collection info retrieved | collection=%s | topic=%s | "
+                "exists=%s | row_count=%s | duration=%.3fs",
+                collection_name, topic.topic_name, exists, row_count, info_time
             )
         except Exception as e:
-            info_time = time.time() - info_start
+            info_time = (time.perf_counter_ns() - info_start) / 1e9
             logger.error(
-                f"Error retrieving collection info | collection={collection_name} | "
-                f"topic={topic.topic_name} | duration={info_time:.3f}s | error={str(e)}",
+                "Error retrieving collection info | collection=%s | topic=%s | "
+                "duration=%.3fs | error=%s",
+                collection_name, topic.topic_name, info_time, e,
                 exc_info=True
             )
             raise
         
-        # Convert to JSON-serializable dict
-        # Using json.loads(json.dumps(...)) to handle any non-serializable objects
-        try:
-            json_str = json.dumps(collection_info, default=lambda x: x.__dict__ if hasattr(x, '__dict__') else str(x))
-            collection_dict = json.loads(json_str)
-        except (TypeError, ValueError):
-            # Fallback: convert to dict manually
-            if hasattr(collection_info, '__dict__'):
-                collection_dict = collection_info.__dict__
-            else:
-                collection_dict = {"info": str(collection_info)}
-        
+        # Fast path: providers normally return a flat dict of primitives
+        # (see PGVectorProvider.get_collection_info), so skip the recursive
+        # walk entirely in the common case
+        if isinstance(collection_info, dict) and all(
+            v is None or isinstance(v, (str, int, float, bool))
+            for v in collection_info.values()
+        ):
+            return collection_info
+
+        # Convert to JSON-serializable dict by walking the structure directly
+        collection_dict = _to_jsonable(collection_info)
+        if not isinstance(collection_dict, dict):
+            collection_dict = {"info": collection_dict}
+
         return collection_dict
     
     async def index_into_vector_db(
@@ -128,165 +340,253 @@ class EvidenceController(BaseController):
         topic: Topic,
         chunks: List[Chunk],
         chunks_ids: List[str],
-        do_reset: bool = False
+        do_reset: bool = False,
+        embed_batch_size: int = 32,
+        insert_batch_size: int = 500
     ) -> bool:
         """
         Index chunks into vector database.
-        
+
+        Embeds texts in batches of embed_batch_size on a worker thread and
+        pipelines the vector inserts (grouped into insert_batch_size) through
+        a bounded asyncio.Queue so embedding of one batch overlaps the
+        database write of the previous one. The queue bound also caps peak
+        memory: at most a few batches of embeddings are alive at once rather
+        than all N vectors.
+
         Args:
             topic: Topic model instance
             chunks: List of Chunk model instances
             chunks_ids: List of chunk UUIDs (strings) corresponding to chunks
             do_reset: Whether to reset collection before indexing (default: False)
-        
+            embed_batch_size: Number of texts sent to the embedding client per call
+            insert_batch_size: Number of vectors written to the vector DB per insert
+
         Returns:
             True if successful
         """
-        start_time = time.time()
+        n = len(chunks)
         logger.info(
-            f"Starting embedding and indexing process | topic={topic.topic_name} | "
-            f"chunks_count={len(chunks)} | chunks_ids_count={len(chunks_ids)} | "
-            f"do_reset={do_reset}"
+            "Starting embedding and indexing process | topic=%s | chunks_count=%d | "
+            "chunks_ids_count=%d | do_reset=%s",
+            topic.topic_name, n, len(chunks_ids), do_reset
         )
+
+        # Empty ingest is a no-op, not an error - without this guard the
+        # pipeline below would raise on the missing first batch
+        if n == 0:
+            logger.info("No chunks to index | topic=%s", topic.topic_name)
+            return True
+        if n != len(chunks_ids):
+            raise ValueError(
+                f"chunks and chunks_ids length mismatch: {n} != {len(chunks_ids)}"
+            )
         
         # Get collection name using topic_name
         collection_name = self.create_collection_name(topic.topic_name)
-        logger.debug(f"Collection name: {collection_name}")
-        
-        # Extract texts from chunks
-        logger.debug("Extracting texts from chunks")
-        texts = [c.chunk_text for c in chunks]
-        total_text_length = sum(len(text) for text in texts)
-        logger.debug(
-            f"Extracted {len(texts)} text(s), total length: {total_text_length} characters"
-        )
-        
-        # Extract metadata from chunks and ensure document_id is included
-        logger.debug("Extracting metadata from chunks")
-        metadata = []
-        for c in chunks:
-            meta = c.chunk_metadata.copy() if c.chunk_metadata else {}
-            # Ensure document_id is in metadata (from chunk_document_id if not already present)
-            if 'document_id' not in meta and hasattr(c, 'chunk_document_id'):
-                meta['document_id'] = c.chunk_document_id
-            # Ensure topic_id is in metadata
-            if 'topic_id' not in meta and hasattr(c, 'chunk_topic_id'):
-                meta['topic_id'] = c.chunk_topic_id
-            metadata.append(meta)
-        
-        # Generate embeddings
-        embedding_start = time.time()
+        logger.debug("Collection name: %s", collection_name)
+        
+        # Extract texts and metadata from chunks in a single pass so the ORM
+        # objects are only traversed once
+        texts = [None] * n
+        metadata = [None] * n
+        for i, c in enumerate(chunks):
+            texts[i] = c.chunk_text
+            orig_meta = c.chunk_metadata
+            # Fast path: metadata written by a previous indexing run already
+            # carries every key this loop would add, so the original dict can
+            # be passed through untouched - no per-chunk copy. The metadata is
+            # read-only from here to the insert boundary.
+            if (
+                orig_meta
+                and 'document_id' in orig_meta
+                and 'topic_id' in orig_meta
+                and 'chunk_id' in orig_meta
+            ):
+                metadata[i] = orig_meta
+                continue
+            meta = orig_meta.copy() if orig_meta else {}
+            # The Chunk schema always defines these columns, so no hasattr
+            # dispatch is needed - setdefault keeps any value already present
+            meta.setdefault('document_id', c.chunk_document_id)
+            meta.setdefault('topic_id', c.chunk_topic_id)
+            # Normalize to canonical key names at ingest so retrieval paths can
+            # use single .get() lookups instead of fallback cascades
+            if 'chunk_id' not in meta:
+                meta['chunk_id'] = chunks_ids[i]
+            if 'page_number' not in meta and 'chunk_page_number' in meta:
+                meta['page_number'] = meta['chunk_page_number']
+            if 'section' not in meta and 'chunk_section' in meta:
+                meta['section'] = meta['chunk_section']
+            metadata[i] = meta
+        # Summing every chunk length is pure logging overhead, so it only runs
+        # when DEBUG is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Extracted %d text(s), total length: %d characters",
+                n, sum(map(len, texts))
+            )
+
+        # Generate embeddings in batches and pipeline the inserts
+        embedding_start = time.perf_counter_ns()
         logger.info(
-            f"Generating embeddings | chunks_count={len(texts)} | "
-            f"model={self.embedding_client.embedding_model_id} | "
-            f"embedding_size={self.embedding_client.embedding_size} | "
-            f"topic={topic.topic_name} | collection={collection_name}"
+            "Generating embeddings | chunks_count=%d | model=%s | embedding_size=%s | "
+            "topic=%s | collection=%s | embed_batch_size=%d | insert_batch_size=%d",
+            n, self.embedding_client.embedding_model_id,
+            self.embedding_client.embedding_size, topic.topic_name, collection_name,
+            embed_batch_size, insert_batch_size
         )
-        
-        try:
-            embeddings = self.embedding_client.embed_text(text=texts, document_type="document")
-            embedding_time = time.time() - embedding_start
-            
-            if not embeddings or len(embeddings) == 0:
-                logger.error(
-                    f"Embedding generation failed: empty result | "
-                    f"chunks_count={len(texts)} | topic={topic.topic_name} | "
-                    f"duration={embedding_time:.3f}s"
-                )
-                raise ValueError("Failed to generate embeddings for chunks")
 
-            if len(embeddings) != len(texts):
-                logger.error(
-                    f"Embedding count mismatch | expected={len(texts)} | "
-                    f"got={len(embeddings)} | topic={topic.topic_name} | "
-                    f"duration={embedding_time:.3f}s"
-                )
-                raise ValueError(
-                    f"Embedding client returned {len(embeddings)} embeddings for "
-                    f"{len(texts)} texts"
+        insert_queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+        # After a reset the collection is empty, so the append-only COPY bulk
+        # load can replace per-row INSERTs when the client supports it
+        insert_fn = None
+        if do_reset:
+            insert_fn = getattr(self.vectordb_client, 'copy_insert', None)
+        if insert_fn is None:
+            insert_fn = self.vectordb_client.insert_many
+
+        # Optional int8 quantization path, resolved once like the insert method
+        quantized_insert_fn = None
+        if self.enable_quantization:
+            quantized_insert_fn = getattr(self.vectordb_client, 'insert_many_int8', None)
+            if quantized_insert_fn is None:
+                logger.warning(
+                    "Quantization enabled but vector DB client has no insert_many_int8 | "
+                    "collection=%s. Falling back to float insertion.",
+                    collection_name
                 )
-            
-            # Log embedding dimension validation
-            embedding_dim = len(embeddings[0]) if embeddings else 0
-            logger.info(
-                f"Embeddings generated successfully | chunks_count={len(texts)} | "
-                f"embeddings_count={len(embeddings)} | embedding_dim={embedding_dim} | "
-                f"topic={topic.topic_name} | duration={embedding_time:.3f}s | "
-                f"avg_time={embedding_time/len(texts):.3f}s/chunk"
-            )
-        except Exception as e:
-            embedding_time = time.time() - embedding_start
-            logger.error(
-                f"Error generating embeddings | chunks_count={len(texts)} | "
-                f"topic={topic.topic_name} | duration={embedding_time:.3f}s | "
-                f"error={str(e)}",
-                exc_info=True
-            )
-            raise
-        
-        # Get embedding size from first embedding
-        embedding_size = len(embeddings[0]) if embeddings else self.vectordb_client.default_vector_size
-        logger.debug(f"Embedding dimension: {embedding_size}")
-        
-        # Create collection
-        collection_start = time.time()
-        logger.info(
-            f"Creating/updating vector database collection | collection={collection_name} | "
-            f"dimension={embedding_size} | do_reset={do_reset} | topic={topic.topic_name}"
-        )
-        try:
-            await self.vectordb_client.create_collection(
-                collection_name,
-                embedding_size,
-                do_reset
-            )
-            collection_time = time.time() - collection_start
-            logger.info(
-                f"Collection ready for indexing | collection={collection_name} | "
-                f"dimension={embedding_size} | topic={topic.topic_name} | "
-                f"duration={collection_time:.3f}s"
-            )
-        except Exception as e:
-            logger.error(
-                f"Error creating collection {collection_name}: {e}",
-                exc_info=True
+
+        async def insert_consumer() -> int:
+            """Drain embedded batches and insert them in insert_batch_size groups."""
+            inserted = 0
+            buf_start: Optional[int] = None
+            buf_embeddings: list = []
+
+            async def flush() -> None:
+                nonlocal inserted, buf_start, buf_embeddings
+                end = buf_start + len(buf_embeddings)
+                if quantized_insert_fn is not None:
+                    int8_embeddings, scale = _quantize_int8(buf_embeddings)
+                    await quantized_insert_fn(
+                        collection_name,
+                        texts[buf_start:end],
+                        metadata[buf_start:end],
+                        int8_embeddings,
+                        scale,
+                        record_ids=chunks_ids[buf_start:end]
+                    )
+                else:
+                    await insert_fn(
+                        collection_name,
+                        texts[buf_start:end],
+                        metadata[buf_start:end],
+                        buf_embeddings,
+                        record_ids=chunks_ids[buf_start:end]
+                    )
+                inserted += len(buf_embeddings)
+                buf_start, buf_embeddings = None, []
+
+            while True:
+                item = await insert_queue.get()
+                if item is None:
+                    break
+                batch_start, batch_embeddings = item
+                if buf_start is None:
+                    buf_start = batch_start
+                buf_embeddings.extend(batch_embeddings)
+                if len(buf_embeddings) >= insert_batch_size:
+                    await flush()
+            if buf_embeddings:
+                await flush()
+            return inserted
+
+        consumer_task = None
+        embedding_dim = 0
+
+        async def put_or_fail(item) -> None:
+            """
+            Enqueue item unless the insert consumer has already exited.
+
+            A plain put() can block forever against the bounded queue if the
+            consumer dies mid-flush (its slot never frees), so the put races
+            the consumer task; when the consumer wins, awaiting it re-raises
+            the insert error here instead of hanging the producer.
+            """
+            put_task = asyncio.create_task(insert_queue.put(item))
+            done, _ = await asyncio.wait(
+                {put_task, consumer_task},
+                return_when=asyncio.FIRST_COMPLETED,
             )
-            raise
-        
-        # Insert into vector database
-        insert_start = time.time()
-        logger.info(
-            f"Inserting vectors into collection | collection={collection_name} | "
-            f"vectors_count={len(chunks_ids)} | embedding_dim={embedding_size} | "
-            f"topic={topic.topic_name}"
-        )
+            if put_task in done:
+                return
+            put_task.cancel()
+            # Propagates the consumer's exception; a normal finish before the
+            # sentinel is itself a bug worth surfacing
+            await consumer_task
+            raise RuntimeError("insert consumer exited before the pipeline finished")
+
         try:
-            await self.vectordb_client.insert_many(
-                collection_name,
-                texts,
-                metadata,
-                embeddings,
-                record_ids=chunks_ids
-            )
-            insert_time = time.time() - insert_start
+            for i in range(0, n, embed_batch_size):
+                batch_texts = texts[i:i + embed_batch_size]
+                # Cache-aware embedding: persisted vectors for unchanged
+                # texts are reused, misses run async natively or on a worker
+                # thread (resolved at init) so the insert consumer keeps going
+                batch_embeddings = await self._embed_documents(batch_texts)
+
+                if not batch_embeddings:
+                    raise ValueError("Failed to generate embeddings for chunks")
+                if len(batch_embeddings) != len(batch_texts):
+                    raise ValueError(
+                        f"Embedding client returned {len(batch_embeddings)} embeddings for "
+                        f"{len(batch_texts)} texts"
+                    )
+
+                if consumer_task is None:
+                    # First batch: the dimension is now known, so the collection
+                    # can be created and the insert consumer started
+                    embedding_dim = len(batch_embeddings[0])
+                    await self.vectordb_client.create_collection(
+                        collection_name,
+                        embedding_dim,
+                        do_reset
+                    )
+                    logger.info(
+                        "Collection ready for indexing | collection=%s | dimension=%d | topic=%s",
+                        collection_name, embedding_dim, topic.topic_name
+                    )
+                    consumer_task = asyncio.create_task(insert_consumer())
+
+                await put_or_fail((i, batch_embeddings))
+
+            await put_or_fail(None)
+            inserted_count = await consumer_task
+
+            pipeline_time = (time.perf_counter_ns() - embedding_start) / 1e9
             logger.info(
-                f"Vectors inserted successfully | collection={collection_name} | "
-                f"vectors_count={len(chunks_ids)} | topic={topic.topic_name} | "
-                f"duration={insert_time:.3f}s | avg_time={insert_time/len(chunks_ids):.3f}s/vector"
+                "Embeddings generated and inserted | chunks_count=%d | inserted_count=%d | "
+                "embedding_dim=%d | topic=%s | collection=%s | duration=%.3fs | "
+                "avg_time=%.3fs/chunk",
+                n, inserted_count, embedding_dim, topic.topic_name,
+                collection_name, pipeline_time, pipeline_time / n
             )
         except Exception as e:
-            insert_time = time.time() - insert_start
+            if consumer_task is not None and not consumer_task.done():
+                consumer_task.cancel()
+            pipeline_time = (time.perf_counter_ns() - embedding_start) / 1e9
             logger.error(
-                f"Error inserting vectors | collection={collection_name} | "
-                f"vectors_count={len(chunks_ids)} | topic={topic.topic_name} | "
-                f"duration={insert_time:.3f}s | error={str(e)}",
+                "Error embedding/indexing chunks | chunks_count=%d | collection=%s | "
+                "topic=%s | duration=%.3fs | error=%s",
+                n, collection_name, topic.topic_name, pipeline_time, e,
                 exc_info=True
             )
             raise
-        
+
         logger.info(
-            f"Embedding and indexing process completed successfully for topic {topic.topic_name}: "
-            f"{len(chunks_ids)} chunks indexed"
+            "Embedding and indexing process completed successfully for topic %s: "
+            "%d chunks indexed",
+            topic.topic_name, n
         )
         
         return True
@@ -294,15 +594,24 @@ class EvidenceController(BaseController):
     async def delete_chunks_from_vector_db(
         self,
         topic: Topic,
-        chunk_ids: List[str]
+        chunk_ids: List[str],
+        batch_size: int = 500,
+        max_concurrency: int = 8
     ) -> bool:
         """
         Delete chunks from vector database by their IDs.
-        
+
+        Large ID lists are split into batch_size groups and deleted
+        concurrently (bounded by max_concurrency) so Postgres runs several
+        small planner-friendly DELETE statements on the pool instead of one
+        enormous one.
+
         Args:
             topic: Topic model instance
             chunk_ids: List of chunk UUIDs to delete
-        
+            batch_size: Number of IDs deleted per statement (default: 500)
+            max_concurrency: Maximum concurrent delete statements (default: 8)
+
         Returns:
             True if successful
         """
@@ -313,40 +622,51 @@ class EvidenceController(BaseController):
         collection_name = self.create_collection_name(topic.topic_name)
         
         # Delete chunks by IDs from vector database
-        delete_start = time.time()
+        delete_start = time.perf_counter_ns()
         logger.info(
-            f"Deleting chunks from vector database | collection={collection_name} | "
-            f"chunks_count={len(chunk_ids)} | topic={topic.topic_name}"
+            "Deleting chunks from vector database | collection=%s | chunks_count=%d | topic=%s",
+            collection_name, len(chunk_ids), topic.topic_name
         )
         
         try:
-            # Assuming vectordb_client has a delete_by_ids method
-            # If not, this will need to be implemented in the vectordb_client
-            if hasattr(self.vectordb_client, 'delete_by_ids'):
-                await self.vectordb_client.delete_by_ids(collection_name, chunk_ids)
-            elif hasattr(self.vectordb_client, 'delete_many'):
-                await self.vectordb_client.delete_many(collection_name, chunk_ids)
-            else:
+            # Delete method is resolved once at init (delete_by_ids or delete_many)
+            if self._delete_by_ids_fn is None:
                 # If no delete method exists, log warning but don't fail
                 logger.warning(
-                    f"Vector database client does not support deleting by IDs | "
-                    f"collection={collection_name} | chunks_count={len(chunk_ids)} | "
-                    f"topic={topic.topic_name}. Chunks may still exist in vector DB."
+                    "Vector database client does not support deleting by IDs | "
+                    "collection=%s | chunks_count=%d | topic=%s. "
+                    "Chunks may still exist in vector DB.",
+                    collection_name, len(chunk_ids), topic.topic_name
                 )
                 return True
-            
-            delete_time = time.time() - delete_start
+
+            if len(chunk_ids) <= batch_size:
+                # Common case: one statement, no task machinery
+                await self._delete_by_ids_fn(collection_name, chunk_ids)
+            else:
+                semaphore = asyncio.Semaphore(max_concurrency)
+
+                async def delete_batch(batch: List[str]) -> None:
+                    async with semaphore:
+                        await self._delete_by_ids_fn(collection_name, batch)
+
+                await asyncio.gather(*(
+                    delete_batch(chunk_ids[i:i + batch_size])
+                    for i in range(0, len(chunk_ids), batch_size)
+                ))
+
+            delete_time = (time.perf_counter_ns() - delete_start) / 1e9
             logger.info(
-                f"Chunks deleted from vector database | collection={collection_name} | "
-                f"chunks_count={len(chunk_ids)} | topic={topic.topic_name} | "
-                f"duration={delete_time:.3f}s"
+                "Chunks deleted from vector database | collection=%s | chunks_count=%d | "
+                "topic=%s | duration=%.3fs",
+                collection_name, len(chunk_ids), topic.topic_name, delete_time
             )
         except Exception as e:
-            delete_time = time.time() - delete_start
+            delete_time = (time.perf_counter_ns() - delete_start) / 1e9
             logger.error(
-                f"Error deleting chunks from vector database | collection={collection_name} | "
-                f"chunks_count={len(chunk_ids)} | topic={topic.topic_name} | "
-                f"duration={delete_time:.3f}s | error={str(e)}",
+                "Error deleting chunks from vector database | collection=%s | "
+                "chunks_count=%d | topic=%s | duration=%.3fs | error=%s",
+                collection_name, len(chunk_ids), topic.topic_name, delete_time, e,
                 exc_info=True
             )
             raise
@@ -357,8 +677,9 @@ class EvidenceController(BaseController):
         self,
         topic: Topic,
         text: str,
-        limit: int = 10
-    ) -> Union[List[RetrievedDocument], bool]:
+        limit: int = 10,
+        min_score: Optional[float] = None
+    ) -> List[RetrievedDocument]:
         """
         Search evidence collection using semantic search.
         
@@ -366,245 +687,311 @@ class EvidenceController(BaseController):
             topic: Topic model instance
             text: Search query text
             limit: Maximum number of results to return (default: 10)
+            min_score: Optional similarity threshold pushed down to the vector
+                database so below-threshold rows are never returned
         
         Returns:
-            List of RetrievedDocument objects or False if error
+            List of RetrievedDocument objects (empty list if no results or on error)
         """
         # Get collection name (use topic_name to match how collections are created)
         collection_name = self.create_collection_name(topic.topic_name)
         logger.debug(
-            f"Search request received | collection={collection_name} | "
-            f"query_length={len(text)} chars | limit={limit} | topic={topic.topic_name}"
-        )
-        
-        # Generate query embedding
-        embedding_start = time.time()
-        logger.info(
-            f"Generating query embedding | query_length={len(text)} chars | "
-            f"model={self.embedding_client.embedding_model_id} | topic={topic.topic_name}"
+            "Search request received | collection=%s | query_length=%d chars | "
+            "limit=%d | topic=%s",
+            collection_name, len(text), limit, topic.topic_name
         )
         
-        try:
-            query_embeddings = self.embedding_client.embed_text(text=text, document_type="query")
-            embedding_time = time.time() - embedding_start
-            
-            # Check if embedding is valid
-            if not query_embeddings or len(query_embeddings) == 0:
-                logger.warning(
-                    f"Query embedding generation returned empty result | "
-                    f"query_length={len(text)} | topic={topic.topic_name} | "
-                    f"duration={embedding_time:.3f}s"
-                )
-                return False
-            
-            # Extract first vector from list if list
-            if isinstance(query_embeddings, list):
-                query_vector = query_embeddings[0] if len(query_embeddings) > 0 else None
-            else:
-                query_vector = query_embeddings
-            
-            if query_vector is None:
-                logger.warning(
-                    f"Query vector is None after extraction | "
-                    f"query_length={len(text)} | topic={topic.topic_name} | "
-                    f"duration={embedding_time:.3f}s"
-                )
-                return False
-            
-            query_dim = len(query_vector) if query_vector else 0
-            logger.info(
-                f"Query embedding generated successfully | query_length={len(text)} | "
-                f"embedding_dim={query_dim} | topic={topic.topic_name} | "
-                f"duration={embedding_time:.3f}s"
+        # Check the query-embedding cache before paying for a model forward pass
+        query_vector = self._get_cached_query_embedding(text)
+        if query_vector is not None:
+            logger.debug(
+                "Query embedding cache hit | query_length=%d chars | topic=%s",
+                len(text), topic.topic_name
             )
-        except Exception as e:
-            embedding_time = time.time() - embedding_start
-            logger.error(
-                f"Error generating query embedding | query_length={len(text)} | "
-                f"topic={topic.topic_name} | duration={embedding_time:.3f}s | "
-                f"error={str(e)}",
-                exc_info=True
+        else:
+            # Generate query embedding
+            embedding_start = time.perf_counter_ns()
+            logger.info(
+                "Generating query embedding | query_length=%d chars | model=%s | topic=%s",
+                len(text), self.embedding_client.embedding_model_id, topic.topic_name
             )
-            return False
+
+            try:
+                query_embeddings = await self._embed_async(text=text, document_type="query")
+                embedding_time = (time.perf_counter_ns() - embedding_start) / 1e9
+
+                # Check if embedding is valid
+                if not query_embeddings or len(query_embeddings) == 0:
+                    logger.warning(
+                        "Query embedding generation returned empty result | "
+                        "query_length=%d | topic=%s | duration=%.3fs",
+                        len(text), topic.topic_name, embedding_time
+                    )
+                    return []
+
+                # Extract first vector from list if list
+                if isinstance(query_embeddings, list):
+                    query_vector = query_embeddings[0] if len(query_embeddings) > 0 else None
+                else:
+                    query_vector = query_embeddings
+
+                if query_vector is None:
+                    logger.warning(
+                        "Query vector is None after extraction | query_length=%d | "
+                        "topic=%s | duration=%.3fs",
+                        len(text), topic.topic_name, embedding_time
+                    )
+                    return []
+
+                logger.info(
+                    "Query embedding generated successfully | query_length=%d | "
+                    "embedding_dim=%d | topic=%s | duration=%.3fs",
+                    len(text), len(query_vector), topic.topic_name, embedding_time
+                )
+
+                # Cache the extracted vector for repeat queries
+                self._store_query_embedding(text, query_vector)
+            except Exception as e:
+                embedding_time = (time.perf_counter_ns() - embedding_start) / 1e9
+                logger.error(
+                    "Error generating query embedding | query_length=%d | topic=%s | "
+                    "duration=%.3fs | error=%s",
+                    len(text), topic.topic_name, embedding_time, e,
+                    exc_info=True
+                )
+                return []
         
         # Search vector database
         logger.info(
-            f"Starting vector search | collection={collection_name} | "
-            f"query_length={len(text)} chars | limit={limit} | topic={topic.topic_name}"
+            "Starting vector search | collection=%s | query_length=%d chars | "
+            "limit=%d | topic=%s",
+            collection_name, len(text), limit, topic.topic_name
         )
         
         try:
-            search_start = time.time()
+            search_start = time.perf_counter_ns()
             results = await self.vectordb_client.search_by_vector(
                 collection_name,
                 query_vector,
-                limit
+                limit,
+                min_score=min_score
             )
-            search_time = time.time() - search_start
+            search_time = (time.perf_counter_ns() - search_start) / 1e9
             
             if not results:
                 logger.warning(
-                    f"Vector search returned no results | collection={collection_name} | "
-                    f"topic={topic.topic_name} | search_time={search_time:.3f}s"
+                    "Vector search returned no results | collection=%s | topic=%s | "
+                    "search_time=%.3fs",
+                    collection_name, topic.topic_name, search_time
                 )
-                return False
+                return []
             
             logger.info(
-                f"Vector search completed | collection={collection_name} | "
-                f"results_count={len(results)} | topic={topic.topic_name} | "
-                f"search_time={search_time:.3f}s"
+                "Vector search completed | collection=%s | results_count=%d | "
+                "topic=%s | search_time=%.3fs",
+                collection_name, len(results), topic.topic_name, search_time
             )
             
         except ValueError as e:
             # Collection doesn't exist
             logger.warning(
-                f"Collection does not exist | collection={collection_name} | "
-                f"topic={topic.topic_name} | error={str(e)}"
+                "Collection does not exist | collection=%s | topic=%s | error=%s",
+                collection_name, topic.topic_name, e
             )
-            return False
+            return []
         except Exception as e:
             logger.error(
-                f"Error during vector search | collection={collection_name} | "
-                f"topic={topic.topic_name} | error={str(e)}",
+                "Error during vector search | collection=%s | topic=%s | error=%s",
+                collection_name, topic.topic_name, e,
                 exc_info=True
             )
-            return False
+            return []
         
-        # Convert results to RetrievedDocument objects
-        logger.debug(f"Converting {len(results)} search results to RetrievedDocument objects")
-        retrieved_docs = []
-        for idx, result in enumerate(results, start=1):
-            try:
-                if isinstance(result, dict):
-                    retrieved_doc = RetrievedDocument(
-                        text=result.get('text', ''),
-                        metadata=result.get('metadata', {}),
-                        score=result.get('score', 0.0)
-                    )
-                elif hasattr(result, 'text') and hasattr(result, 'metadata'):
-                    retrieved_doc = RetrievedDocument(
-                        text=result.text,
-                        metadata=result.metadata if hasattr(result.metadata, '__dict__') else {},
-                        score=getattr(result, 'score', 0.0)
-                    )
-                else:
-                    logger.warning(
-                        f"Unexpected result format at index {idx} | "
-                        f"type={type(result)} | collection={collection_name}"
-                    )
-                    continue
-                
-                retrieved_docs.append(retrieved_doc)
-                
-            except Exception as e:
-                logger.warning(
-                    f"Error converting result at index {idx} | "
-                    f"collection={collection_name} | error={str(e)}"
-                )
-                continue
+        logger.debug("Converting %d search results to RetrievedDocument objects", len(results))
+        retrieved_docs = _to_retrieved_documents(results)
         
-        logger.info(
-            f"Search results processed successfully | collection={collection_name} | "
-            f"topic={topic.topic_name} | retrieved_docs_count={len(retrieved_docs)} | "
-            f"original_results_count={len(results)}"
+        logger.debug(
+            "Search results processed | collection=%s | topic=%s | retrieved_docs_count=%d",
+            collection_name, topic.topic_name, len(retrieved_docs)
         )
         
-        return retrieved_docs if retrieved_docs else False
+        return retrieved_docs
     
     async def verify_claim(
         self,
         topic: Topic,
         claim: str,
-        limit: int = 10
+        limit: int = 10,
+        include_refuting: bool = True
     ) -> Tuple[Optional[str], List[dict], List[dict]]:
         """
         Verify a claim by searching for relevant evidence chunks.
-        
+
         Args:
             topic: Topic model instance
             claim: Claim text to verify
             limit: Maximum number of results to return (default: 10)
-        
+            include_refuting: Also return below-threshold evidence. When
+                False the support threshold is pushed into the vector DB
+                query, so refuting rows are filtered at the database instead
+                of being serialized back and partitioned here.
+
         Returns:
             Tuple of (claim, supporting_evidence, refuting_evidence)
             - claim: The original claim text or None if no results
             - supporting_evidence: List of evidence dicts supporting the claim
-            - refuting_evidence: List of evidence dicts refuting the claim (empty for now)
-        
+            - refuting_evidence: List of evidence dicts refuting the claim
+              (always empty when include_refuting is False)
+
         Note:
             This method does NOT use LLM generation - only retrieval and formatting.
             Classification of supporting vs refuting evidence would require additional logic.
         """
-        verify_start = time.time()
+        verify_start = time.perf_counter_ns()
         collection_name = self.create_collection_name(topic.topic_name)
         logger.info(
-            f"Starting claim verification | claim_length={len(claim)} chars | "
-            f"limit={limit} | topic={topic.topic_name} | collection={collection_name}"
+            "Starting claim verification | claim_length=%d chars | limit=%d | "
+            "topic=%s | collection=%s",
+            len(claim), limit, topic.topic_name, collection_name
         )
-        
-        # Search for relevant chunks
-        search_results = await self.search_evidence_collection(topic, claim, limit)
-        
+
+        # Search for relevant chunks; callers that only want supporting
+        # evidence get the threshold evaluated where the distance is already
+        # computed - in the database - so refuting rows never cross the wire
+        min_score = None if include_refuting else _SUPPORT_SCORE_THRESHOLD
+        search_results = await self.search_evidence_collection(
+            topic, claim, limit, min_score=min_score
+        )
+
         # If no results, return empty
-        if not search_results or search_results is False:
-            verify_time = time.time() - verify_start
+        if not search_results:
+            verify_time = (time.perf_counter_ns() - verify_start) / 1e9
             logger.warning(
-                f"Claim verification returned no evidence | claim_length={len(claim)} | "
-                f"topic={topic.topic_name} | collection={collection_name} | "
-                f"duration={verify_time:.3f}s"
+                "Claim verification returned no evidence | claim_length=%d | topic=%s | "
+                "collection=%s | duration=%.3fs",
+                len(claim), topic.topic_name, collection_name, verify_time
             )
             return (None, [], [])
         
         # Process results into evidence format
         logger.debug(
-            f"Processing {len(search_results)} search results for claim verification | "
-            f"topic={topic.topic_name}"
+            "Processing %d search results for claim verification | topic=%s",
+            len(search_results), topic.topic_name
         )
-        supporting_evidence = []
-        refuting_evidence = []  # Currently empty - would need classification logic
-        
-        for idx, result in enumerate(search_results, start=1):
+        if not include_refuting:
+            # The database already filtered on the threshold, so every result
+            # is supporting evidence - no partition pass needed
+            supporting_evidence = [_to_evidence_dict(r) for r in search_results]
+            refuting_evidence = []
+        else:
+            supporting_evidence, refuting_evidence = _partition_evidence(search_results)
+        
+        verify_time = (time.perf_counter_ns() - verify_start) / 1e9
+        logger.info(
+            "Claim verification completed | claim_length=%d | topic=%s | collection=%s | "
+            "supporting_evidence_count=%d | refuting_evidence_count=%d | "
+            "total_results=%d | duration=%.3fs",
+            len(claim), topic.topic_name, collection_name,
+            len(supporting_evidence), len(refuting_evidence),
+            len(search_results), verify_time
+        )
+
+        return (claim, supporting_evidence, refuting_evidence)
+
+    async def verify_claims(
+        self,
+        topic: Topic,
+        claims: List[str],
+        limit: int = 10
+    ) -> List[Tuple[Optional[str], List[dict], List[dict]]]:
+        """
+        Verify a batch of claims against a topic's evidence collection.
+
+        All claim texts are embedded in a single embedding-client call
+        (amortizing per-call overhead across the batch) and the vector
+        searches fan out concurrently with asyncio.gather, so verifying N
+        claims costs one embedding round-trip plus the slowest search
+        instead of N sequential embed-then-search cycles.
+
+        Args:
+            topic: Topic model instance
+            claims: Claim texts to verify
+            limit: Maximum number of results per claim (default: 10)
+
+        Returns:
+            List aligned with claims of (claim, supporting_evidence,
+            refuting_evidence) tuples, each shaped like verify_claim's
+            return value; a claim whose search failed or returned nothing
+            yields (None, [], [])
+        """
+        if not claims:
+            return []
+
+        verify_start = time.perf_counter_ns()
+        collection_name = self.create_collection_name(topic.topic_name)
+        logger.info(
+            "Starting batch claim verification | claims_count=%d | limit=%d | "
+            "topic=%s | collection=%s",
+            len(claims), limit, topic.topic_name, collection_name
+        )
+
+        # Resolve cached query embeddings first, then embed all misses in one
+        # call so the batch pays at most one embedding round-trip
+        query_vectors: List[Optional[list]] = [
+            self._get_cached_query_embedding(claim) for claim in claims
+        ]
+        missing_idx = [i for i, v in enumerate(query_vectors) if v is None]
+        if missing_idx:
+            missing_claims = [claims[i] for i in missing_idx]
             try:
-                if isinstance(result, RetrievedDocument):
-                    # Extract chunk_id from metadata
-                    chunk_id = result.metadata.get('chunk_id') or result.metadata.get('id')
-                    chunk_document_id = result.metadata.get('chunk_document_id') or result.metadata.get('document_id')
-                    
-                    # Format evidence dict
-                    evidence_dict = {
-                        "chunk_text": result.text,
-                        "chunk_id": chunk_id,
-                        "document": result.metadata.get('document', {}),
-                        "page_number": result.metadata.get('chunk_page_number') or result.metadata.get('page_number'),
-                        "section": result.metadata.get('chunk_section') or result.metadata.get('section'),
-                        "similarity_score": result.score
-                    }
-                    
-                    # For now, all evidence is considered supporting
-                    # In the future, this could be classified based on similarity score or other criteria
-                    if result.score > 0.5:  # Threshold for supporting evidence
-                        supporting_evidence.append(evidence_dict)
-                    else:
-                        refuting_evidence.append(evidence_dict)
-                else:
-                    logger.warning(
-                        f"Unexpected result type in verify_claim at index {idx} | "
-                        f"type={type(result)} | topic={topic.topic_name}"
-                    )
+                fresh = await self._embed_async(text=missing_claims, document_type="query")
             except Exception as e:
+                logger.error(
+                    "Error embedding claim batch | claims_count=%d | topic=%s | error=%s",
+                    len(missing_claims), topic.topic_name, e,
+                    exc_info=True
+                )
+                return [(None, [], []) for _ in claims]
+            if not fresh or len(fresh) != len(missing_claims):
+                logger.warning(
+                    "Claim batch embedding returned %d vectors for %d claims | topic=%s",
+                    len(fresh) if fresh else 0, len(missing_claims), topic.topic_name
+                )
+                return [(None, [], []) for _ in claims]
+            for j, i in enumerate(missing_idx):
+                query_vectors[i] = fresh[j]
+                self._store_query_embedding(claims[i], fresh[j])
+
+        # Fan the searches out concurrently; exceptions are captured per claim
+        # so one failing search doesn't sink the batch
+        search_results = await asyncio.gather(
+            *(
+                self.vectordb_client.search_by_vector(collection_name, vector, limit)
+                for vector in query_vectors
+            ),
+            return_exceptions=True
+        )
+
+        verifications: List[Tuple[Optional[str], List[dict], List[dict]]] = []
+        for claim, results in zip(claims, search_results):
+            if isinstance(results, BaseException):
                 logger.warning(
-                    f"Error processing result at index {idx} in verify_claim | "
-                    f"topic={topic.topic_name} | error={str(e)}"
+                    "Claim search failed in batch | claim_length=%d | topic=%s | error=%s",
+                    len(claim), topic.topic_name, results
                 )
+                verifications.append((None, [], []))
                 continue
-        
-        verify_time = time.time() - verify_start
+            if not results:
+                verifications.append((None, [], []))
+                continue
+            supporting, refuting = _partition_evidence(_to_retrieved_documents(results))
+            verifications.append((claim, supporting, refuting))
+
+        verify_time = (time.perf_counter_ns() - verify_start) / 1e9
         logger.info(
-            f"Claim verification completed | claim_length={len(claim)} | "
-            f"topic={topic.topic_name} | collection={collection_name} | "
-            f"supporting_evidence_count={len(supporting_evidence)} | "
-            f"refuting_evidence_count={len(refuting_evidence)} | "
-            f"total_results={len(search_results)} | duration={verify_time:.3f}s"
+            "Batch claim verification completed | claims_count=%d | topic=%s | "
+            "collection=%s | duration=%.3fs",
+            len(claims), topic.topic_name, collection_name, verify_time
         )
-        
-        return (claim, supporting_evidence, refuting_evidence)
+
+        return verifications
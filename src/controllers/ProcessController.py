@@ -1,5 +1,10 @@
 """Process controller for document processing and chunk extraction"""
+import asyncio
+import itertools
+import logging
 import os
+import re
+from collections import deque
 from typing import Union, List, Optional, Tuple, Any, Callable
 from langchain_community.document_loaders import TextLoader, PyMuPDFLoader
 from langchain_core.documents import Document as LangChainDocument
@@ -16,7 +21,32 @@ logger = get_logger(__name__)
 
 class ProcessController(BaseController):
     """Controller for document processing and chunk extraction"""
-    
+
+    # Extension -> loader factory dispatch table: one dict lookup per call
+    # instead of an if/elif chain, and adding a format is a one-line entry
+    _LOADERS = {
+        '.txt': lambda file_path: TextLoader(file_path, encoding="utf-8"),
+        '.pdf': PyMuPDFLoader,
+    }
+
+    # Chunks persisted per insert_many_chunks call during streaming ingestion
+    _INSERT_BATCH_SIZE = 500
+
+    # Config is immutable after startup, so the chunking parameters are
+    # resolved once at import instead of getattr-with-default per upload
+    _CHUNK_SIZE = getattr(config, "chunk_size", 1000)
+    _CHUNK_OVERLAP = getattr(config, "chunk_overlap", 200)
+
+    # Hierarchical separator cascade, compiled once: paragraph breaks, then
+    # single newlines, then sentence ends. One scan yields segments that
+    # respect document structure, so the accumulator packs chunks without
+    # splitting mid-sentence when PDFs lack trailing newlines.
+    _SEP_RE = re.compile(r"\n{2,}|\n|(?<=[.!?])\s+")
+
+    # Shared across instances: get_topic_path is memoized at module level in
+    # TopicController, so constructing a controller per document bought nothing
+    _topic_controller = TopicController()
+
     def __init__(self, topic_name: str):
         """
         Initialize ProcessController with topic name.
@@ -27,9 +57,8 @@ class ProcessController(BaseController):
         super().__init__()
         self.topic_name = topic_name
         
-        # Get topic path using TopicController and store as project_path
-        topic_controller = TopicController()
-        self.project_path = topic_controller.get_topic_path(topic_name)
+        # Topic path resolution hits the shared memoized TopicController
+        self.project_path = self._topic_controller.get_topic_path(topic_name)
     
     def get_file_extension(self, document_id: str) -> str:
         """
@@ -43,6 +72,28 @@ class ProcessController(BaseController):
         """
         _, ext = os.path.splitext(document_id)
         return ext.lower()  # Normalize to lowercase for comparison
+
+    def _log_topic_directory_listing(self) -> None:
+        """
+        Debug-log the topic directory contents after a missing-file error.
+
+        Only runs when DEBUG is enabled, so production deployments pay no
+        directory scan for the diagnostic. scandir streams entries in one
+        syscall batch instead of the exists + listdir stat pair.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        try:
+            with os.scandir(self.project_path) as entries:
+                files_in_dir = [entry.name for entry in entries]
+            logger.debug(
+                "Files in topic directory (%s): %s",
+                self.project_path, files_in_dir,
+            )
+        except FileNotFoundError:
+            logger.debug("Topic directory does not exist: %s", self.project_path)
+        except Exception as e:
+            logger.warning(f"Could not list topic directory: {e}")
     
     def get_file_loader(self, file_path: str) -> Optional[object]:
         """
@@ -53,34 +104,19 @@ class ProcessController(BaseController):
         
         Returns:
             LangChain loader instance (TextLoader or PyMuPDFLoader) or None if unsupported
+
+        Note:
+            The file's existence is not checked here; the loader's open()
+            performs that stat anyway, so a missing file surfaces as
+            FileNotFoundError from load() in get_file_content
         """
-        # Check if file exists
-        if not os.path.exists(file_path):
-            logger.error(
-                f"File not found at path: {file_path} | "
-                f"topic_id={self.topic_id} | project_path={self.project_path}"
-            )
-            # List files in topic directory for debugging
-            if os.path.exists(self.project_path):
-                try:
-                    files_in_dir = os.listdir(self.project_path)
-                    logger.debug(f"Files in topic directory ({self.project_path}): {files_in_dir}")
-                except Exception as e:
-                    logger.warning(f"Could not list topic directory: {e}")
-            return None
-        
-        # Get file extension
+        # Dispatch on the (lowercased) extension via the class-level table
         extension = self.get_file_extension(file_path)
-        logger.debug(f"File extension: {extension} for {file_path}")
-        
-        # Return appropriate loader based on extension
-        if extension == '.txt':
-            return TextLoader(file_path, encoding="utf-8")
-        elif extension == '.pdf':
-            return PyMuPDFLoader(file_path)
-        else:
+        loader_factory = self._LOADERS.get(extension)
+        if loader_factory is None:
             logger.warning(f"Unsupported file extension: {extension} for {file_path}")
             return None
+        return loader_factory(file_path)
     
     def get_file_content(self, file_path: str) -> Optional[List[LangChainDocument]]:
         """
@@ -103,14 +139,29 @@ class ProcessController(BaseController):
         
         # Call loader.load() if loader exists
         try:
-            logger.debug(f"Calling loader.load() for: {file_path}")
+            logger.debug("Calling loader.load() for: %s", file_path)
             documents = loader.load()
             logger.info(
-                f"Successfully loaded file | path={file_path} | "
-                f"documents_count={len(documents)} | "
-                f"total_chars={sum(len(doc.page_content) for doc in documents)}"
+                "Successfully loaded file | path=%s | documents_count=%d",
+                file_path, len(documents),
             )
+            if logger.isEnabledFor(logging.DEBUG):
+                # Summing page lengths walks every page; only pay for it
+                # when the extra detail is actually emitted
+                logger.debug(
+                    "Loaded file total_chars=%d | path=%s",
+                    sum(len(doc.page_content) for doc in documents), file_path,
+                )
             return documents
+        except FileNotFoundError:
+            # No pre-flight os.path.exists in get_file_loader: the open()
+            # inside load() is the single stat, and a missing file lands here
+            logger.error(
+                f"File not found at path: {file_path} | "
+                f"topic_name={self.topic_name} | project_path={self.project_path}"
+            )
+            self._log_topic_directory_listing()
+            return None
         except Exception as e:
             # Log error and return None
             logger.error(
@@ -133,31 +184,34 @@ class ProcessController(BaseController):
             file_content: List of LangChain Document objects from loader
             document_id: Document identifier
             chunk_size: Size of each chunk in characters (default: 100)
-            overlap_size: Overlap size between chunks (default: 20, not used in simple splitter)
+            overlap_size: Overlap size between chunks in characters (default: 20)
         
         Returns:
             List of LangChain Document objects with chunks
         """
         logger.debug(
-            f"Processing file content: {len(file_content)} document(s), "
-            f"chunk_size={chunk_size}, overlap_size={overlap_size}"
+            "Processing file content: %d document(s), chunk_size=%d, overlap_size=%d",
+            len(file_content), chunk_size, overlap_size,
         )
         
         # Extract page_content from each document
         texts = [doc.page_content for doc in file_content]
-        total_text_length = sum(len(text) for text in texts)
-        logger.debug(
-            f"Extracted {len(texts)} text segment(s), total length: {total_text_length} characters"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Summing segment lengths is O(total chars); only pay for it
+            # when DEBUG is actually emitted
+            logger.debug(
+                "Extracted %d text segment(s), total length: %d characters",
+                len(texts), sum(len(text) for text in texts),
+            )
         
         # Extract metadata from each document (preserve page numbers if available)
         metadatas = [doc.metadata for doc in file_content]
         
         # Call process_simpler_splitter with texts, metadatas, chunk_size
         logger.debug("Starting text splitting process")
-        chunks = self.process_simpler_splitter(texts, metadatas, chunk_size)
+        chunks = self.process_simpler_splitter(texts, metadatas, chunk_size, overlap_size=overlap_size)
         
-        logger.debug(f"Text splitting completed: {len(chunks)} chunks created")
+        logger.debug("Text splitting completed: %d chunks created", len(chunks))
         return chunks
     
     def process_simpler_splitter(
@@ -165,77 +219,251 @@ class ProcessController(BaseController):
         texts: List[str],
         metadatas: List[dict],
         chunk_size: int,
-        splitter_tag: str = "\n"
+        splitter_tag: str = "\n",
+        overlap_size: int = 0
     ) -> List[LangChainDocument]:
         """
         Simple text splitter that splits by newline and accumulates lines until chunk_size.
-        
+
+        Consecutive chunks share a sliding-window overlap: each new chunk is
+        seeded with the tail lines of the previous one until their character
+        sum reaches overlap_size.
+
         Args:
             texts: List of text strings
             metadatas: List of metadata dictionaries (preserve page numbers)
             chunk_size: Maximum size of each chunk in characters
             splitter_tag: Tag to split by (default: "\n" for newline)
-        
+            overlap_size: Characters of the previous chunk carried into the
+                next one (default: 0, no overlap)
+
         Returns:
             List of LangChain Document objects with chunks
         """
         logger.debug(
-            f"Splitting {len(texts)} text segment(s) with chunk_size={chunk_size}, "
-            f"splitter_tag={repr(splitter_tag)}"
+            "Splitting %d text segment(s) with chunk_size=%d, splitter_tag=%r",
+            len(texts), chunk_size, splitter_tag,
         )
-        
-        # Join all texts with space
-        combined_text = " ".join(texts)
-        combined_length = len(combined_text)
-        logger.debug(f"Combined text length: {combined_length} characters")
-        
-        # Split by splitter_tag (newline)
-        lines = combined_text.split(splitter_tag)
-        logger.debug(f"Split into {len(lines)} lines")
-        
-        # Filter empty lines (length > 1 after strip)
-        filtered_lines = [line for line in lines if len(line.strip()) > 1]
-        logger.debug(f"Filtered to {len(filtered_lines)} non-empty lines")
-        
-        # Accumulate lines until chunk_size is reached
-        chunks = []
-        current_chunk = []
+
+        # Strip each line exactly once and remember which source segment
+        # (page) it came from - joining all texts into one string first would
+        # destroy the page-to-line mapping and mislabel every chunk's page
+        stripped_lines: List[str] = []
+        line_metadata: List[dict] = []
+        if metadatas and len(metadatas) == len(texts):
+            pairs = zip(texts, metadatas)
+        else:
+            shared_meta: dict = metadatas[0] if metadatas else {}
+            pairs = ((text, shared_meta) for text in texts)
+        append_line = stripped_lines.append
+        append_meta = line_metadata.append
+        # The default tag uses the hierarchical separator regex; an explicit
+        # custom tag keeps plain str.split semantics
+        if splitter_tag == "\n":
+            split_segments = self._SEP_RE.split
+        else:
+            split_segments = lambda text: text.split(splitter_tag)
+        for text, meta in pairs:
+            for line in split_segments(text):
+                stripped = line.strip()
+                if len(stripped) > 1:
+                    append_line(stripped)
+                    append_meta(meta)
+        logger.debug("Filtered to %d non-empty lines", len(stripped_lines))
+
+        # Accumulate by index: each chunk is a contiguous slice of
+        # stripped_lines, so the join runs once per flush over that slice
+        # instead of rebuilding a per-chunk list line by line. The running
+        # size includes the joining space so chunks respect chunk_size.
+        # Each chunk carries the metadata of the page its first line came
+        # from (shared references - consumers treat metadata as read-only).
+        #
+        # The output list is pre-sized from the total character count so it
+        # is filled by index instead of growing through geometric resizes;
+        # overlap shrinks the effective step per chunk, so it feeds the
+        # estimate. An underestimate degrades gracefully to append.
+        total_size = sum(len(line) + 1 for line in stripped_lines)
+        step = max(chunk_size - overlap_size, 1)
+        expected = (total_size // step) + 1
+        chunks: List[LangChainDocument] = [None] * expected
+        out_i = 0
+        join_lines = " ".join
+        start = 0
         current_size = 0
-        current_metadata = metadatas[0] if metadatas else {}  # Use first metadata as base
-        
-        for line in filtered_lines:
-            line_stripped = line.strip()
-            line_size = len(line_stripped)
-            
+
+        def emit_chunk(doc: LangChainDocument) -> None:
+            nonlocal out_i
+            if out_i < expected:
+                chunks[out_i] = doc
+            else:
+                chunks.append(doc)
+            out_i += 1
+
+        for i, line in enumerate(stripped_lines):
+            line_size = len(line) if current_size == 0 else len(line) + 1
+
             # If adding this line would exceed chunk_size, save current chunk and start new one
-            if current_size + line_size > chunk_size and current_chunk:
-                # Create chunk from accumulated lines
-                chunk_text = " ".join(current_chunk).strip()
-                if chunk_text:
-                    chunks.append(LangChainDocument(
-                        page_content=chunk_text,
-                        metadata=current_metadata.copy()
-                    ))
-                
-                # Reset for new chunk
-                current_chunk = [line_stripped]
-                current_size = line_size
+            if current_size + line_size > chunk_size and i > start:
+                emit_chunk(LangChainDocument(
+                    page_content=join_lines(stripped_lines[start:i]),
+                    metadata=line_metadata[start]
+                ))
+                # Overlap is just backtracking the slice start: walk back
+                # until the carried tail reaches overlap_size characters,
+                # always leaving at least one line behind so chunks advance
+                if overlap_size > 0:
+                    j = i
+                    carried = 0
+                    while j - 1 > start and carried < overlap_size:
+                        j -= 1
+                        carried += len(stripped_lines[j]) + 1
+                    start = j
+                else:
+                    start = i
+                current_size = sum(len(l) + 1 for l in stripped_lines[start:i + 1]) - 1
             else:
-                # Add line to current chunk
-                current_chunk.append(line_stripped)
                 current_size += line_size
-        
+
         # Add remaining chunk if any
-        if current_chunk:
-            chunk_text = " ".join(current_chunk).strip()
-            if chunk_text:
-                chunks.append(LangChainDocument(
-                    page_content=chunk_text,
-                    metadata=current_metadata.copy()
-                ))
-        
+        if start < len(stripped_lines):
+            emit_chunk(LangChainDocument(
+                page_content=join_lines(stripped_lines[start:]),
+                metadata=line_metadata[start]
+            ))
+
+        # Trim unfilled slots from an overestimate
+        del chunks[out_i:]
         return chunks
-    
+
+    def _iter_pages(self, file_path: str):
+        """
+        Yield (page_text, metadata) pairs one page at a time.
+
+        PDFs are read directly with fitz so only the current page's text is
+        in memory, instead of loader.load() materializing every page as a
+        document up front. Text files yield a single pair.
+
+        Args:
+            file_path: Full absolute path to the file
+
+        Yields:
+            Tuples of (text: str, metadata: dict)
+
+        Raises:
+            ValueError: If the file extension is unsupported
+        """
+        extension = self.get_file_extension(file_path)
+        if extension == '.pdf':
+            import fitz  # PyMuPDF - same backend PyMuPDFLoader uses
+
+            doc = fitz.open(file_path)
+            try:
+                for page_index, page in enumerate(doc):
+                    yield page.get_text("text"), {
+                        "page": page_index + 1,
+                        "source": file_path,
+                    }
+            finally:
+                doc.close()
+        elif extension == '.txt':
+            with open(file_path, encoding="utf-8") as f:
+                yield f.read(), {"source": file_path}
+        else:
+            raise ValueError(f"Unsupported file extension: {extension} for {file_path}")
+
+    def _iter_raw_chunks(
+        self,
+        page_iter,
+        chunk_size: int,
+        overlap_size: int = 0,
+        splitter_tag: str = "\n"
+    ):
+        """
+        Stream (chunk_text, metadata) tuples out of a page iterator.
+
+        Runs the same strip-and-accumulate logic as process_simpler_splitter
+        but as a generator over (text, metadata) pairs, so peak memory is one
+        page plus one chunk rather than the whole document, and callers can
+        start persisting chunks before the file is fully read. Consecutive
+        chunks share a sliding-window overlap of overlap_size characters.
+
+        Yielding plain tuples keeps the ingest hot path free of wrapper
+        objects; _iter_chunks wraps them in LangChain Documents for callers
+        that want the Document interface.
+
+        Args:
+            page_iter: Iterable of (text, metadata) pairs (see _iter_pages)
+            chunk_size: Maximum size of each chunk in characters
+            overlap_size: Characters of the previous chunk carried into the
+                next one (default: 0, no overlap)
+            splitter_tag: Tag to split by (default: "\\n" for newline)
+
+        Yields:
+            (chunk_text, metadata) tuples; metadata is the shared page
+            metadata dict of the chunk's first line (read-only downstream)
+        """
+        # Buffer entries are (line, page_metadata) so overlap lines carried
+        # across a flush keep the page they originated on; each chunk takes
+        # the shared metadata dict of its first line (read-only downstream)
+        buffer: List[tuple] = []
+        current_size = 0
+
+        if splitter_tag == "\n":
+            split_segments = self._SEP_RE.split
+        else:
+            split_segments = lambda text: text.split(splitter_tag)
+
+        for page_text, page_metadata in page_iter:
+            for line in split_segments(page_text):
+                stripped = line.strip()
+                if len(stripped) <= 1:
+                    continue
+                line_size = len(stripped) if current_size == 0 else len(stripped) + 1
+                if current_size + line_size > chunk_size and buffer:
+                    yield " ".join([l for l, _ in buffer]), buffer[0][1]
+                    if overlap_size > 0 and len(buffer) > 1:
+                        # Retain the shortest tail of the flushed chunk that
+                        # reaches overlap_size characters, leaving at least
+                        # one line behind so chunks always advance
+                        tail: deque = deque()
+                        carried = 0
+                        max_tail = len(buffer) - 1
+                        for item in reversed(buffer):
+                            if carried >= overlap_size or len(tail) >= max_tail:
+                                break
+                            tail.appendleft(item)
+                            carried += len(item[0]) + 1
+                        buffer = list(tail)
+                    else:
+                        buffer = []
+                    buffer.append((stripped, page_metadata))
+                    current_size = sum([len(l) + 1 for l, _ in buffer]) - 1
+                else:
+                    buffer.append((stripped, page_metadata))
+                    current_size += line_size
+
+        if buffer:
+            yield " ".join([l for l, _ in buffer]), buffer[0][1]
+
+    def _iter_chunks(
+        self,
+        page_iter,
+        chunk_size: int,
+        overlap_size: int = 0,
+        splitter_tag: str = "\n"
+    ):
+        """
+        Stream chunks as LangChain Documents (see _iter_raw_chunks).
+
+        Thin wrapper for callers that want the Document interface; the
+        ingest path consumes _iter_raw_chunks directly to skip the
+        wrapper allocation per chunk.
+        """
+        for chunk_text, metadata in self._iter_raw_chunks(
+            page_iter, chunk_size, overlap_size=overlap_size, splitter_tag=splitter_tag
+        ):
+            yield LangChainDocument(page_content=chunk_text, metadata=metadata)
+
     async def chunk_and_store_document(
         self,
         file_path: str,
@@ -269,13 +497,7 @@ class ProcessController(BaseController):
                 f"topic_id={topic.topic_id} | document_db_id={document_db_id} | "
                 f"project_path={self.project_path}"
             )
-            # List files in topic directory for debugging
-            if os.path.exists(self.project_path):
-                try:
-                    files_in_dir = os.listdir(self.project_path)
-                    logger.debug(f"Files in topic directory ({self.project_path}): {files_in_dir}")
-                except Exception as e:
-                    logger.warning(f"Could not list topic directory: {e}")
+            self._log_topic_directory_listing()
             return [], []
         
         # Extract filename for logging
@@ -285,109 +507,160 @@ class ProcessController(BaseController):
             f"absolute_path={file_path} | topic_id={topic.topic_id}"
         )
         
-        # Load file content using the absolute path directly
-        logger.info(f"Loading file content from absolute path: {file_path}")
-        file_content = self.get_file_content(file_path)
-        if file_content is None:
-            logger.error(
-                f"Failed to load file content for chunking | file_path={file_path} | "
-                f"filename={filename_on_disk} | topic_id={topic.topic_id} | "
-                f"document_db_id={document_db_id} | project_path={self.project_path}"
-            )
-            return [], []
-        
-        logger.info(
-            f"File loaded successfully | file_path={file_path} | "
-            f"documents_count={len(file_content)} | "
-            f"total_chars={sum(len(doc.page_content) for doc in file_content)}"
-        )
-        
         # Chunk the file content using configured chunk_size / overlap
-        chunk_size = getattr(config, "chunk_size", 1000)
-        chunk_overlap = getattr(config, "chunk_overlap", 200)
+        chunk_size = self._CHUNK_SIZE
+        chunk_overlap = self._CHUNK_OVERLAP
         logger.info(
-            f"Starting chunking process with chunk_size={chunk_size}, "
-            f"chunk_overlap={chunk_overlap}"
+            f"Starting streaming chunking process with chunk_size={chunk_size}, "
+            f"chunk_overlap={chunk_overlap} | file_path={file_path}"
         )
-        
-        chunk_docs = self.process_file_content(
-            file_content=file_content,
-            document_id=filename_on_disk,
-            chunk_size=chunk_size,
-            overlap_size=chunk_overlap,
+
+        # Stream pages -> chunks -> database in insert_batch_size groups, so
+        # peak memory holds one page plus one insert batch rather than the
+        # whole document, and the first insert happens before the last page
+        # is read
+        chunk_model = await ChunkModel.create_instance(db_client)
+
+        from src.models.db_schemas.citatum.schemas.chunk import Chunk as ChunkSchema
+
+        all_chunks: List[Any] = []
+        inserted_count = 0
+        idx = 0
+
+        # PDF parsing and chunk accumulation are blocking (fitz is CPU+IO
+        # bound), so the generator is advanced one insert batch at a time on
+        # a worker thread - the event loop keeps serving other coroutines
+        # while a batch is being produced, and inserts run between batches
+        chunk_iter = self._iter_raw_chunks(
+            self._iter_pages(file_path), chunk_size, overlap_size=chunk_overlap
         )
-        
-        if not chunk_docs:
+
+        def next_batch() -> List[tuple]:
+            return list(itertools.islice(chunk_iter, self._INSERT_BATCH_SIZE))
+
+        # Loop invariants hoisted out of the per-chunk loop: topic_id is an
+        # attribute lookup on every iteration otherwise
+        topic_id = topic.topic_id
+
+        try:
+            while True:
+                batch_docs = await asyncio.to_thread(next_batch)
+                if not batch_docs:
+                    break
+
+                # Batch length is known, so the entity list is pre-sized
+                # and filled by index instead of grown through appends
+                batch_entities: List[Any] = [None] * len(batch_docs)
+                for batch_i, (chunk_text, meta) in enumerate(batch_docs):
+                    idx += 1
+
+                    # Derive page number / section from metadata if available
+                    page_number = meta.get("page") or meta.get("page_number")
+                    section = meta.get("section")
+
+                    # Chunk metadata built in a single allocation, merging the
+                    # source metadata with the per-chunk context keys
+                    batch_entities[batch_i] = ChunkSchema(
+                        chunk_text=chunk_text,
+                        chunk_metadata={
+                            **meta,
+                            "chunk_order": idx,
+                            "chunk_page_number": page_number,
+                            "chunk_section": section,
+                            "document_id": document_db_id,
+                            "topic_id": topic_id,
+                        },
+                        chunk_order=idx,
+                        chunk_page_number=page_number,
+                        chunk_section=section,
+                        chunk_topic_id=topic_id,
+                        chunk_document_id=document_db_id,
+                    )
+
+                inserted_count += await chunk_model.insert_many_chunks(batch_entities)
+                logger.debug(
+                    "Inserted %d chunks so far for document %s",
+                    inserted_count, document_db_id,
+                )
+                all_chunks.extend(batch_entities)
+        except Exception as e:
+            logger.error(
+                f"Failed to stream-chunk document | file_path={file_path} | "
+                f"filename={filename_on_disk} | topic_id={topic.topic_id} | "
+                f"document_db_id={document_db_id} | error={str(e)}",
+                exc_info=True
+            )
+            return [], []
+
+        if inserted_count == 0:
             logger.warning(
                 f"No chunks generated for document {document_db_id} "
                 f"(topic_id={topic.topic_id})"
             )
             return [], []
-        
-        logger.info(
-            f"Chunking completed: {len(chunk_docs)} chunks created from document "
-            f"{document_db_id}"
-        )
-        
-        # Persist chunks into database
-        logger.info(f"Preparing to persist {len(chunk_docs)} chunks to database")
-        chunk_model = await ChunkModel.create_instance(db_client)
-        chunk_entities = []
-        
-        from src.models.db_schemas.citatum.schemas.chunk import Chunk as ChunkSchema
-        
-        logger.debug("Building chunk entities from LangChain documents")
-        for idx, lc_doc in enumerate(chunk_docs, start=1):
-            meta = dict(lc_doc.metadata or {})
-            
-            # Derive page number / section from metadata if available
-            page_number = meta.get("page") or meta.get("page_number")
-            section = meta.get("section")
-            
-            # Build chunk metadata to store additional context
-            chunk_metadata = {
-                **meta,
-                "chunk_order": idx,
-                "chunk_page_number": page_number,
-                "chunk_section": section,
-                "document_id": document_db_id,
-                "topic_id": topic.topic_id,
-            }
-            
-            chunk_entity = ChunkSchema(
-                chunk_text=lc_doc.page_content,
-                chunk_metadata=chunk_metadata,
-                chunk_order=idx,
-                chunk_page_number=page_number,
-                chunk_section=section,
-                chunk_topic_id=topic.topic_id,
-                chunk_document_id=document_db_id,
-            )
-            chunk_entities.append(chunk_entity)
-            
-            # Log progress for large documents (every 100 chunks)
-            if idx % 100 == 0:
-                logger.debug(f"Processed {idx}/{len(chunk_docs)} chunks")
-        
-        logger.info(f"Inserting {len(chunk_entities)} chunks into database")
-        inserted_count = await chunk_model.insert_many_chunks(chunk_entities)
+
         logger.info(
             f"Successfully inserted {inserted_count} chunks for document {document_db_id} "
             f"(topic_id={topic.topic_id})"
         )
         
-        # Reload chunks from DB to get their primary keys
-        logger.debug(f"Reloading chunks from database to get primary keys")
-        all_chunks = await chunk_model.get_document_chunks(
-            document_id=document_db_id,
-            page_no=1,
-            page_size=max(inserted_count, 1_000_000),
-        )
+        # No reload needed for primary keys: the server-generated UUIDs come
+        # back on the INSERT itself (SQLAlchemy's implicit RETURNING populates
+        # them at flush, and the session factory sets expire_on_commit=False,
+        # so the attributes stay loaded after commit)
         chunk_ids = [c.chunk_id for c in all_chunks]
         
         logger.info(
             f"Chunking process completed successfully for document {document_db_id}: "
             f"{len(chunk_ids)} chunks stored (topic_id={topic.topic_id})"
         )
-        
-        return all_chunks, chunk_ids
\ No newline at end of file
+
+        return all_chunks, chunk_ids
+
+    async def chunk_and_store_documents(
+        self,
+        file_paths: List[str],
+        topic: Topic,
+        document_db_ids: List[str],
+        db_client: Callable,
+        concurrency: int = 4,
+    ) -> List[Tuple[List[Any], List[str]]]:
+        """
+        Chunk and store several documents of a topic concurrently.
+
+        Documents in a topic have no data dependency on each other, so
+        fanning out lets one file's PDF parsing (on a worker thread)
+        overlap with another file's database inserts. Concurrency is
+        bounded by a semaphore to cap worker threads and open sessions.
+
+        Args:
+            file_paths: Full paths to the saved document files
+            topic: Topic model instance
+            document_db_ids: Database IDs aligned with file_paths
+            db_client: Database client (session factory)
+            concurrency: Maximum documents processed at once
+
+        Returns:
+            List aligned with file_paths of (all_chunks, chunk_ids) tuples;
+            a failed document yields ([], []) like the single-document path
+        """
+        if len(file_paths) != len(document_db_ids):
+            raise ValueError(
+                f"file_paths and document_db_ids length mismatch: "
+                f"{len(file_paths)} != {len(document_db_ids)}"
+            )
+        if not file_paths:
+            return []
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def process_one(file_path: str, document_db_id: str):
+            async with sem:
+                return await self.chunk_and_store_document(
+                    file_path, topic, document_db_id, db_client
+                )
+
+        return list(await asyncio.gather(*(
+            process_one(file_path, document_db_id)
+            for file_path, document_db_id in zip(file_paths, document_db_ids)
+        )))
\ No newline at end of file
@@ -1,4 +1,5 @@
 """Topic controller for research topic directory management"""
+import functools
 import os
 from typing import Union
 
@@ -25,15 +26,20 @@ class TopicController(BaseController):
         Raises:
             OSError: If directory creation fails
         """
-        try:
-            # Sanitize topic_name for filesystem safety
-            # Replace any path separators and other unsafe characters
-            safe_topic_name = topic_name.replace("/", "_").replace("\\", "_").replace("..", "_")
-            topic_path = os.path.join(self.files_dir, safe_topic_name)
-            
-            # Create directory if it doesn't exist
-            os.makedirs(topic_path, exist_ok=True)
-            
-            return os.path.abspath(topic_path)
-        except OSError as e:
-            raise OSError(f"Failed to create topic directory for topic_name {topic_name}: {e}") from e
+        # Topic paths are immutable for a topic's lifetime, so resolution and
+        # directory creation are memoized across controller instances
+        return _topic_path(self.files_dir, topic_name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _topic_path(files_dir: str, topic_name: str) -> str:
+    """Resolve (and create once) the directory for a topic."""
+    try:
+        # Sanitize topic_name for filesystem safety
+        # Replace any path separators and other unsafe characters
+        safe_topic_name = topic_name.replace("/", "_").replace("\\", "_").replace("..", "_")
+        # files_dir is already absolute, so the join needs no abspath pass
+        topic_path = os.path.join(files_dir, safe_topic_name)
+        return BaseController._ensure_dir(topic_path)
+    except OSError as e:
+        raise OSError(f"Failed to create topic directory for topic_name {topic_name}: {e}") from e
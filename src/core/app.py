@@ -1,4 +1,5 @@
 """FastAPI application factory"""
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
@@ -14,14 +15,8 @@ from src.utils.metrics import setup_metrics
 logger = get_logger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan events"""
-    # Startup
-    logger.info(f"Starting {config.app_name} v{config.app_version}")
-    logger.info(f"Server running on {config.api_host}:{config.api_port}")
-    
-    # Initialize database client
+async def _init_database(app: FastAPI) -> None:
+    """Initialize the database session factory on app.state (required)."""
     try:
         db_session_factory = create_db_session_factory(config)
         app.state.db_client = db_session_factory
@@ -29,12 +24,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database client: {e}")
         raise
-    
-    # Initialize vector database client
+
+
+async def _init_vectordb(app: FastAPI) -> None:
+    """Initialize the vector database client on app.state (optional)."""
     try:
         vectordb_factory = VectorDBProviderFactory(config)
         vectordb_client = vectordb_factory.create(config.vector_db_type.upper())
-        
+
         if vectordb_client is None:
             logger.warning(
                 f"Failed to create vector database client for provider: {config.vector_db_type}. "
@@ -48,8 +45,10 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize vector database client: {e}", exc_info=True)
         # Don't raise - vector DB might not be critical for all operations
         app.state.vectordb_client = None
-    
-    # Initialize embedding client
+
+
+async def _init_embedding(app: FastAPI) -> None:
+    """Initialize the embedding client on app.state (optional)."""
     try:
         llm_factory = LLMProviderFactory(config)
         embedding_client = llm_factory.create(config.llm_provider.upper())
@@ -62,7 +61,26 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize embedding client: {e}")
         app.state.embedding_client = None
-    
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan events"""
+    # Startup
+    logger.info(f"Starting {config.app_name} v{config.app_version}")
+    logger.info(f"Server running on {config.api_host}:{config.api_port}")
+
+    # The three clients are independent, so their startup work runs
+    # concurrently: total startup latency is the slowest init rather than
+    # the sum. Only the database init is fatal; gather propagates its
+    # exception while the optional inits record their own failures as a
+    # None client, same as before.
+    await asyncio.gather(
+        _init_database(app),
+        _init_vectordb(app),
+        _init_embedding(app),
+    )
+
     yield
     
     # Shutdown
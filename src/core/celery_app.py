@@ -1,4 +1,6 @@
 """Celery application configuration"""
+import os
+
 from celery import Celery
 from src.utils.config import config
 from src.utils.logger import get_logger
@@ -33,8 +35,9 @@ celery_app.conf.update(
     task_ignore_result=False,
     result_expires=3600,
 
-    # Worker settings
-    worker_concurrency=2,
+    # Worker settings - size to the machine: document processing is
+    # dominated by PDF parsing, which scales per worker process
+    worker_concurrency=os.cpu_count() or 2,
 
     # Connection settings for better reliability
     broker_connection_retry_on_startup=True,
@@ -43,13 +46,16 @@ celery_app.conf.update(
     worker_cancel_long_running_tasks_on_connection_loss=True,
 
     task_routes={
-        "src.tasks.document_tasks.document_upload_and_process": {"queue": "default"},
+        # CPU-heavy parsing gets its own queue so document uploads cannot
+        # starve short maintenance tasks on the default queue. Keys match
+        # the explicit name= the tasks register under (no "src." prefix).
+        "tasks.document_tasks.document_upload_and_process": {"queue": "pdf"},
     },
 
     # Beat schedule for periodic tasks (uncomment when tasks are implemented)
     beat_schedule={
         'cleanup-old-task-records': {
-            'task': "src.tasks.maintenance.clean_celery_executions_table",
+            'task': "tasks.maintenance.clean_celery_executions_table",
             'schedule': 3600,  # every hour
             'args': ()
         }
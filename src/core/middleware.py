@@ -4,6 +4,15 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.utils.config import config
 
+# Parsed once at import: cors_origins is fixed for the process lifetime,
+# so each app creation reuses the same list instead of re-splitting
+if config.cors_origins == "*":
+    _CORS_ORIGINS = ["*"]
+else:
+    _CORS_ORIGINS = [
+        origin.strip() for origin in config.cors_origins.split(",") if origin.strip()
+    ]
+
 
 def setup_middleware(app: FastAPI) -> None:
     """
@@ -16,15 +25,9 @@ def setup_middleware(app: FastAPI) -> None:
         app: FastAPI application instance
     """
     # CORS middleware - should be added first (executed last)
-    # Parse CORS origins from config (comma-separated string or "*" for all)
-    if config.cors_origins == "*":
-        cors_origins = ["*"]
-    else:
-        cors_origins = [origin.strip() for origin in config.cors_origins.split(",") if origin.strip()]
-    
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=cors_origins,
+        allow_origins=_CORS_ORIGINS,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
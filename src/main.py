@@ -24,6 +24,10 @@ def main():
         port=config.api_port,
         reload=config.debug,
         log_config=log_config,
+        # uvloop ships with uvicorn[standard]; pin it explicitly so the
+        # event loop choice does not silently fall back to asyncio
+        loop="uvloop",
+        http="httptools",
     )
 
 
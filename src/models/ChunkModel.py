@@ -1,6 +1,7 @@
 """Chunk data model for evidence chunk data access"""
-from typing import Callable
-from sqlalchemy import select, delete, func
+import json
+from typing import Callable, Iterable
+from sqlalchemy import select, delete, func, insert, tuple_, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.BaseDataModel import BaseDataModel
@@ -9,6 +10,10 @@ from src.models.db_schemas.citatum.schemas.chunk import Chunk
 
 class ChunkModel(BaseDataModel):
     """Data model for chunk operations"""
+
+    # Built once at import: the PK lookup runs constantly, so the statement
+    # skips per-call construction and always hits the compiled cache
+    _GET_BY_ID_STMT = select(Chunk).where(Chunk.chunk_id == bindparam('cid'))
     
     def __init__(self, db_client: object):
         """
@@ -41,12 +46,14 @@ class ChunkModel(BaseDataModel):
             chunk: Chunk instance to create
         
         Returns:
-            Created chunk with refreshed data
+            Created chunk with server-generated fields populated
         """
         async with self.db_client() as session:
             session.add(chunk)
+            # No refresh needed: the INSERT's RETURNING already brings back
+            # the server-generated id and timestamps (eager defaults on the
+            # asyncpg dialect), and expire_on_commit=False keeps them loaded
             await session.commit()
-            await session.refresh(chunk)
             return chunk
     
     async def get_chunk(self, chunk_id: str) -> Chunk | None:
@@ -60,8 +67,7 @@ class ChunkModel(BaseDataModel):
             Chunk instance or None if not found
         """
         async with self.db_client() as session:
-            stmt = select(Chunk).where(Chunk.chunk_id == chunk_id)
-            result = await session.execute(stmt)
+            result = await session.execute(self._GET_BY_ID_STMT, {'cid': chunk_id})
             return result.scalar_one_or_none()
     
     async def insert_many_chunks(
@@ -80,14 +86,113 @@ class ChunkModel(BaseDataModel):
             Number of chunks inserted
         """
         async with self.db_client() as session:
-            total_inserted = 0
+            # Flush in batches to bound dirty-state size, but commit once:
+            # one transaction (and one fsync) per call instead of one per
+            # batch. Each flush goes out via insertmanyvalues, which also
+            # populates server-generated primary keys on the entities.
             for i in range(0, len(chunks), batch_size):
-                batch = chunks[i:i + batch_size]
-                session.add_all(batch)
-                await session.commit()
-                total_inserted += len(batch)
-            return total_inserted
+                session.add_all(chunks[i:i + batch_size])
+                await session.flush()
+            await session.commit()
+            return len(chunks)
+
+    async def bulk_insert_returning_ids(self, rows: list[dict]) -> list[str]:
+        """
+        Insert chunk rows via the Core bulk path, returning their UUIDs.
+
+        Skips ORM instance construction and instrumentation entirely, so it
+        is the fastest insert path when the caller works with plain dicts
+        and does not need Chunk entities afterwards.
+
+        Args:
+            rows: List of column-name -> value dicts for the chunks table
+
+        Returns:
+            List of generated chunk UUIDs, in insert order
+        """
+        if not rows:
+            return []
+        async with self.db_client() as session:
+            stmt = insert(Chunk).returning(Chunk.chunk_id)
+            result = await session.execute(stmt, rows)
+            await session.commit()
+            return list(result.scalars().all())
     
+    # Column order for the COPY fast path; chunk_id and timestamps are
+    # filled by their server defaults
+    _COPY_COLUMNS = (
+        'chunk_text',
+        'chunk_metadata',
+        'chunk_order',
+        'chunk_page_number',
+        'chunk_section',
+        'chunk_topic_id',
+        'chunk_document_id',
+    )
+
+    async def copy_many_chunks(self, rows: Iterable[tuple]) -> None:
+        """
+        Bulk-load chunk rows through PostgreSQL COPY.
+
+        COPY streams rows in binary framing instead of per-row INSERT
+        protocol messages, which is the fastest ingest path for large
+        documents. Unlike the insert paths it returns no generated ids, so
+        it suits ingest flows that fetch ids separately (or not at all).
+        Falls back to the Core bulk insert when the driver connection does
+        not expose copy_records_to_table (non-asyncpg).
+
+        Args:
+            rows: Iterable of tuples matching _COPY_COLUMNS order; the
+                chunk_metadata element must be a dict (serialized here) or
+                None
+        """
+        async with self.db_client() as session:
+            conn = await session.connection()
+            raw = await conn.get_raw_connection()
+            driver_conn = getattr(raw, 'driver_connection', None)
+            if driver_conn is None or not hasattr(driver_conn, 'copy_records_to_table'):
+                # Non-asyncpg driver: reuse the Core bulk path
+                await session.rollback()
+                dict_rows = [
+                    dict(zip(self._COPY_COLUMNS, row)) for row in rows
+                ]
+                await self.bulk_insert_returning_ids(dict_rows)
+                return
+            # asyncpg's jsonb codec expects text, not dicts
+            records = (
+                row[:1] + (json.dumps(row[1]) if row[1] is not None else None,) + row[2:]
+                for row in rows
+            )
+            await driver_conn.copy_records_to_table(
+                'chunks',
+                records=records,
+                columns=list(self._COPY_COLUMNS),
+            )
+            await session.commit()
+
+    async def get_chunk_ids_by_document_id(self, document_id: str) -> list[str]:
+        """
+        Get all chunk UUIDs for a document without hydrating full Chunk objects.
+
+        Projects only the primary key, so the result skips chunk_text and
+        metadata entirely, and returns IDs in chunk_order so callers see
+        document order.
+
+        Args:
+            document_id: Document UUID to filter by
+
+        Returns:
+            List of chunk UUIDs ordered by chunk_order
+        """
+        async with self.db_client() as session:
+            stmt = (
+                select(Chunk.chunk_id)
+                .where(Chunk.chunk_document_id == document_id)
+                .order_by(Chunk.chunk_order)
+            )
+            result = await session.execute(stmt)
+            return list(result.scalars().all())
+
     async def delete_chunks_by_document_id(self, document_id: str) -> int:
         """
         Delete all chunks for a document, return row count.
@@ -99,7 +204,13 @@ class ChunkModel(BaseDataModel):
             Number of chunks deleted
         """
         async with self.db_client() as session:
-            stmt = delete(Chunk).where(Chunk.chunk_document_id == document_id)
+            # Nothing from this session is kept around, so skip the
+            # identity-map synchronization pass the default strategy runs
+            stmt = (
+                delete(Chunk)
+                .where(Chunk.chunk_document_id == document_id)
+                .execution_options(synchronize_session=False)
+            )
             result = await session.execute(stmt)
             await session.commit()
             return result.rowcount
@@ -123,15 +234,71 @@ class ChunkModel(BaseDataModel):
         """
         async with self.db_client() as session:
             offset = (page_no - 1) * page_size
+            # Ordering matches the ix_chunk_doc_order index, so pages come
+            # back deterministic and in document order from a single index
+            # range scan
             stmt = (
                 select(Chunk)
                 .where(Chunk.chunk_document_id == document_id)
+                .order_by(Chunk.chunk_order, Chunk.chunk_id)
                 .offset(offset)
                 .limit(page_size)
             )
             result = await session.execute(stmt)
             return list(result.scalars().all())
     
+    async def get_document_chunks_keyset(
+        self,
+        document_id: str,
+        after_order: int | None = None,
+        after_id: str | None = None,
+        page_size: int = 50
+    ) -> tuple[list[Chunk], dict | None]:
+        """
+        Get chunks for a document using keyset (seek) pagination.
+
+        The cursor is the (chunk_order, chunk_id) pair of the last row of
+        the previous page; the row-constructor comparison lets the
+        ix_chunk_doc_order index jump straight to the page start, so deep
+        pages cost the same as the first. A page_size + 1 probe detects
+        whether more rows exist without a count query.
+
+        Args:
+            document_id: Document UUID to filter by
+            after_order: chunk_order component of the cursor, or None for
+                the first page
+            after_id: chunk_id component of the cursor
+            page_size: Number of items per page
+
+        Returns:
+            Tuple of (list of chunks, next cursor dict with after_order /
+            after_id keys, or None when exhausted)
+        """
+        async with self.db_client() as session:
+            stmt = select(Chunk).where(Chunk.chunk_document_id == document_id)
+            if after_order is not None:
+                stmt = stmt.where(
+                    tuple_(Chunk.chunk_order, Chunk.chunk_id)
+                    > tuple_(after_order, after_id)
+                )
+            stmt = (
+                stmt
+                .order_by(Chunk.chunk_order, Chunk.chunk_id)
+                .limit(page_size + 1)
+            )
+            result = await session.execute(stmt)
+            rows = list(result.scalars().all())
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                last = rows[-1]
+                next_cursor = {
+                    "after_order": last.chunk_order,
+                    "after_id": last.chunk_id,
+                }
+            else:
+                next_cursor = None
+            return rows, next_cursor
+
     async def get_total_chunks_count(self, document_id: str) -> int:
         """
         Get total chunk count for a document.
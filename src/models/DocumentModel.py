@@ -1,15 +1,26 @@
 """Document data model for academic document management"""
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, func, bindparam
 from src.models.BaseDataModel import BaseDataModel
 from src.models.db_schemas.citatum.schemas.document import Document
 
 
 class DocumentModel(BaseDataModel):
     """Data model for document operations"""
-    
+
+    # Cap on the per-instance lookup cache; model instances live for one
+    # request/task, so this only guards against pathological key counts
+    _CACHE_MAX_SIZE = 128
+
+    # Built once at import so the hot PK lookup skips per-call statement
+    # construction and always hits the compiled cache
+    _GET_BY_ID_STMT = select(Document).where(Document.document_id == bindparam('did'))
+
     def __init__(self, db_client: object):
         super().__init__(db_client=db_client)
         self.db_client = db_client
+        # Per-instance cache: repeated id lookups within one request hit
+        # memory instead of a SELECT round-trip; mutations invalidate
+        self._document_by_id_cache: dict = {}
     
     @classmethod
     async def create_instance(cls, db_client: object) -> "DocumentModel":
@@ -18,8 +29,9 @@ class DocumentModel(BaseDataModel):
     async def create_document(self, document: Document) -> Document:
         async with self.db_client() as session:
             session.add(document)
+            # Server defaults come back on the INSERT's RETURNING; with
+            # expire_on_commit=False no reload is needed after commit
             await session.commit()
-            await session.refresh(document)
             return document
     
     async def get_all_topic_documents(
@@ -42,30 +54,76 @@ class DocumentModel(BaseDataModel):
             Tuple of (list of documents, total count)
         """
         async with self.db_client() as session:
-            async with session.begin():
-                # Get total count
+            # One round-trip: count(*) OVER () rides on the same scan as the
+            # page itself, so data and total arrive together
+            offset = (page - 1) * page_size
+            stmt = (
+                select(Document, func.count().over().label("total"))
+                .where(Document.document_topic_id == topic_id)
+                .where(Document.document_type == document_type)
+                .offset(offset)
+                .limit(page_size)
+            )
+            result = await session.execute(stmt)
+            rows = result.all()
+            if rows:
+                total_count = rows[0].total
+                documents = [row.Document for row in rows]
+            else:
+                # Page past the end (or empty set): fall back to a bare count
                 count_query = (
                     select(func.count(Document.document_id))
                     .where(Document.document_topic_id == topic_id)
                     .where(Document.document_type == document_type)
                 )
-                count_result = await session.execute(count_query)
-                total_count = count_result.scalar_one()
-                
-                # Get paginated documents
-                offset = (page - 1) * page_size
-                stmt = (
-                    select(Document)
-                    .where(Document.document_topic_id == topic_id)
-                    .where(Document.document_type == document_type)
-                    .offset(offset)
-                    .limit(page_size)
-                )
-                result = await session.execute(stmt)
-                documents = list(result.scalars().all())
-                
-                return documents, total_count
+                total_count = (await session.execute(count_query)).scalar_one()
+                documents = []
+
+            return documents, total_count
     
+    async def get_all_topic_documents_keyset(
+        self,
+        topic_id: str,
+        document_type: str = "PDF",
+        after_id: str | None = None,
+        page_size: int = 10
+    ) -> tuple[list[Document], str | None]:
+        """
+        Get documents for a topic using keyset (seek) pagination.
+
+        Unlike OFFSET paging, the index range scan jumps straight to the
+        cursor position, so deep pages cost the same as the first one. A
+        page_size + 1 probe detects whether more rows exist without a
+        count query.
+
+        Args:
+            topic_id: Topic UUID to filter by
+            document_type: Document type to filter by
+            after_id: Cursor - document_id of the last row of the previous
+                page, or None for the first page
+            page_size: Number of items per page
+
+        Returns:
+            Tuple of (list of documents, next cursor or None when exhausted)
+        """
+        async with self.db_client() as session:
+            stmt = (
+                select(Document)
+                .where(Document.document_topic_id == topic_id)
+                .where(Document.document_type == document_type)
+            )
+            if after_id is not None:
+                stmt = stmt.where(Document.document_id > after_id)
+            stmt = stmt.order_by(Document.document_id).limit(page_size + 1)
+            result = await session.execute(stmt)
+            rows = list(result.scalars().all())
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                next_cursor = rows[-1].document_id
+            else:
+                next_cursor = None
+            return rows, next_cursor
+
     async def get_document_record(self, topic_id: str, document_name: str) -> Document | None:
         """
         Get specific document by topic_id and name.
@@ -96,10 +154,16 @@ class DocumentModel(BaseDataModel):
         Returns:
             Document instance or None if not found
         """
+        if document_id in self._document_by_id_cache:
+            return self._document_by_id_cache[document_id]
         async with self.db_client() as session:
-            stmt = select(Document).where(Document.document_id == document_id)
-            result = await session.execute(stmt)
-            return result.scalar_one_or_none()
+            result = await session.execute(self._GET_BY_ID_STMT, {'did': document_id})
+            document = result.scalar_one_or_none()
+            if document is not None:
+                if len(self._document_by_id_cache) >= self._CACHE_MAX_SIZE:
+                    self._document_by_id_cache.clear()
+                self._document_by_id_cache[document_id] = document
+            return document
     
     async def insert_many_documents(self,documents: list[Document],batch_size: int = 100) -> int:
         """
@@ -113,13 +177,14 @@ class DocumentModel(BaseDataModel):
             Number of documents inserted
         """
         async with self.db_client() as session:
-            total_inserted = 0
+            # Flush in batches to bound dirty-state size, but commit once:
+            # one transaction per call instead of one per batch, with each
+            # flush going out through insertmanyvalues
             for i in range(0, len(documents), batch_size):
-                batch = documents[i:i + batch_size]
-                session.add_all(batch)
-                await session.commit()
-                total_inserted += len(batch)
-            return total_inserted
+                session.add_all(documents[i:i + batch_size])
+                await session.flush()
+            await session.commit()
+            return len(documents)
     
     async def delete_document(self, document_id: str) -> bool:
         """
@@ -132,9 +197,14 @@ class DocumentModel(BaseDataModel):
             True if document was deleted, False if not found
         """
         async with self.db_client() as session:
-            stmt = delete(Document).where(Document.document_id == document_id)
+            stmt = (
+                delete(Document)
+                .where(Document.document_id == document_id)
+                .execution_options(synchronize_session=False)
+            )
             result = await session.execute(stmt)
             await session.commit()
+            self._document_by_id_cache.pop(document_id, None)
             return result.rowcount > 0
     
     async def delete_all_topic_documents(self, topic_id: str) -> int:
@@ -148,7 +218,13 @@ class DocumentModel(BaseDataModel):
             Number of documents deleted
         """
         async with self.db_client() as session:
-            stmt = delete(Document).where(Document.document_topic_id == topic_id)
+            stmt = (
+                delete(Document)
+                .where(Document.document_topic_id == topic_id)
+                .execution_options(synchronize_session=False)
+            )
             result = await session.execute(stmt)
             await session.commit()
+            # Bulk delete cannot tell which cached ids were removed
+            self._document_by_id_cache.clear()
             return result.rowcount
\ No newline at end of file
@@ -1,15 +1,36 @@
 """Topic data model for research topic data access"""
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy import func, bindparam
 from .db_schemas.citatum.schemas.topic import Topic
 from .BaseDataModel import BaseDataModel
 
 
 class TopicModel(BaseDataModel):
 
+    # Cap on the per-instance lookup caches; model instances live for one
+    # request/task, so this only guards against pathological key counts
+    _CACHE_MAX_SIZE = 128
+
+    # Built once at import so the hot single-row lookups skip per-call
+    # statement construction and always hit the compiled cache
+    _GET_BY_ID_STMT = select(Topic).where(Topic.topic_id == bindparam('tid'))
+    _GET_BY_NAME_STMT = select(Topic).where(Topic.topic_name == bindparam('tname'))
+
     def __init__(self, db_client: object):
         super().__init__(db_client=db_client)
         self.db_client = db_client
+        # Per-instance caches: a model instance is created per request or
+        # task, so repeated id/name lookups within one request hit memory
+        # instead of paying a BEGIN/SELECT/COMMIT round-trip each time.
+        # Mutating methods invalidate the affected keys.
+        self._topic_by_id_cache: dict = {}
+        self._topic_by_name_cache: dict = {}
+
+    def _cache_put(self, cache: dict, key, value) -> None:
+        """Store a lookup result, clearing the cache if it grows too large."""
+        if len(cache) >= self._CACHE_MAX_SIZE:
+            cache.clear()
+        cache[key] = value
 
     @classmethod
     async def create_instance(cls, db_client: object) -> "TopicModel":
@@ -18,22 +39,27 @@ class TopicModel(BaseDataModel):
     async def create_topic(self, topic: Topic) -> Topic:
         async with self.db_client() as session:
             session.add(topic)
+            # Server defaults come back on the INSERT's RETURNING; with
+            # expire_on_commit=False no reload is needed after commit
             await session.commit()
-            await session.refresh(topic)
+            # A cached miss for this name/id is now stale
+            self._topic_by_name_cache.pop(topic.topic_name, None)
+            self._topic_by_id_cache.pop(topic.topic_id, None)
             return topic
 
     async def get_topic_or_create(self, topic_name: str) -> Topic:
         async with self.db_client() as session:
-            async with session.begin():
-                query = select(Topic).where(Topic.topic_name == topic_name)
-                topic = await session.execute(query)
-                topic = topic.scalar_one_or_none()
-                if topic is None:
-                    topic_to_create = Topic(topic_name=topic_name)
-                    topic_to_create = await self.create_topic(topic_to_create)
-                    return topic_to_create
-                else:
-                    return topic
+            # Read-only lookup: no explicit BEGIN/COMMIT round-trips; the
+            # insert path commits inside create_topic's own session
+            query = select(Topic).where(Topic.topic_name == topic_name)
+            topic = await session.execute(query)
+            topic = topic.scalar_one_or_none()
+            if topic is None:
+                topic_to_create = Topic(topic_name=topic_name)
+                topic_to_create = await self.create_topic(topic_to_create)
+                return topic_to_create
+            else:
+                return topic
 
     async def get_topic_by_id(self, topic_id: str) -> Topic | None: 
         """
@@ -45,13 +71,16 @@ class TopicModel(BaseDataModel):
         Returns:
             Topic instance or None if not found
         """
+        if topic_id in self._topic_by_id_cache:
+            return self._topic_by_id_cache[topic_id]
         async with self.db_client() as session:
-            async with session.begin():
-                query = select(Topic).where(Topic.topic_id == topic_id)
-                topic = await session.execute(query)
-                topic = topic.scalar_one_or_none()
-                return topic
-                      
+            topic = await session.execute(self._GET_BY_ID_STMT, {'tid': topic_id})
+            topic = topic.scalar_one_or_none()
+            if topic is not None:
+                self._cache_put(self._topic_by_id_cache, topic_id, topic)
+            return topic
+
+    
     async def get_topic_by_name(self, topic_name: str) -> Topic | None:
         """
         Get topic by name.
@@ -62,12 +91,44 @@ class TopicModel(BaseDataModel):
         Returns:
             Topic instance or None if not found
         """
+        if topic_name in self._topic_by_name_cache:
+            return self._topic_by_name_cache[topic_name]
         async with self.db_client() as session:
-            async with session.begin():
-                query = select(Topic).where(Topic.topic_name == topic_name)
-                topic = await session.execute(query)
-                topic = topic.scalar_one_or_none()
-                return topic
+            topic = await session.execute(self._GET_BY_NAME_STMT, {'tname': topic_name})
+            topic = topic.scalar_one_or_none()
+            if topic is not None:
+                self._cache_put(self._topic_by_name_cache, topic_name, topic)
+            return topic
+
+    async def get_all_topics_keyset(
+        self,
+        after_id: str | None = None,
+        page_size: int = 10
+    ) -> tuple[list[Topic], str | None]:
+        """
+        Get topics using keyset (seek) pagination.
+
+        Args:
+            after_id: Cursor - topic_id of the last row of the previous
+                page, or None for the first page
+            page_size: Number of items per page
+
+        Returns:
+            Tuple of (list of topics, next cursor or None when exhausted)
+        """
+        async with self.db_client() as session:
+            query = select(Topic)
+            if after_id is not None:
+                query = query.where(Topic.topic_id > after_id)
+            query = query.order_by(Topic.topic_id).limit(page_size + 1)
+            result = await session.execute(query)
+            rows = list(result.scalars().all())
+            if len(rows) > page_size:
+                rows = rows[:page_size]
+                next_cursor = rows[-1].topic_id
+            else:
+                next_cursor = None
+            return rows, next_cursor
 
     async def get_all_topics(self, page: int = 1, page_size: int = 10) -> tuple[list[Topic], int]:
         """
@@ -81,17 +142,24 @@ class TopicModel(BaseDataModel):
             Tuple of (list of topics, total count)
         """
         async with self.db_client() as session:
-            async with session.begin():
-                # Get total count
+            # One round-trip: count(*) OVER () rides on the same scan as the
+            # page itself, so data and total arrive together
+            offset = (page - 1) * page_size
+            query = (
+                select(Topic, func.count().over().label("total"))
+                .offset(offset)
+                .limit(page_size)
+            )
+            result = await session.execute(query)
+            rows = result.all()
+            if rows:
+                total_count = rows[0].total
+                topics = [row.Topic for row in rows]
+            else:
+                # Page past the end (or empty set): fall back to a bare count
                 count_query = select(func.count(Topic.topic_id))
-                count_result = await session.execute(count_query)
-                total_count = count_result.scalar_one()
-                
-                # Get paginated topics
-                offset = (page - 1) * page_size
-                query = select(Topic).offset(offset).limit(page_size)
-                result = await session.execute(query)
-                topics = list(result.scalars().all())
-                
-                return topics, total_count
+                total_count = (await session.execute(count_query)).scalar_one()
+                topics = []
+
+            return topics, total_count
             
@@ -0,0 +1,40 @@
+"""add_chunk_covering_index
+
+Revision ID: 3b8c5d1e6f2a
+Revises: 7d2e4f8a9c1b
+Create Date: 2026-08-26 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8c5d1e6f2a'
+down_revision: Union[str, None] = '7d2e4f8a9c1b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index for per-document chunk reads: the key matches the
+    # filter + ordering (chunk_document_id, chunk_order, chunk_id), so
+    # paginated fetches and the chunk-id projection resolve as a single
+    # index range scan. chunk_text deliberately stays out of the index:
+    # INCLUDE'd columns cannot be TOASTed, so any chunk over the ~2.7 KB
+    # index-row limit (the splitter emits oversized chunks when a segment
+    # has no split point) would fail its INSERT outright. Subsumes the
+    # single-column ix_chunk_document_id, which is dropped to save write
+    # amplification.
+    op.create_index(
+        'ix_chunk_doc_order',
+        'chunks',
+        ['chunk_document_id', 'chunk_order', 'chunk_id'],
+        unique=False,
+    )
+    op.drop_index('ix_chunk_document_id', table_name='chunks')
+
+
+def downgrade() -> None:
+    op.create_index('ix_chunk_document_id', 'chunks', ['chunk_document_id'], unique=False)
+    op.drop_index('ix_chunk_doc_order', table_name='chunks')
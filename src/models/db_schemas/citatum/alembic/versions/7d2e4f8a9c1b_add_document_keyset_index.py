@@ -0,0 +1,33 @@
+"""add_document_keyset_index
+
+Revision ID: 7d2e4f8a9c1b
+Revises: 5c6a0b7b1f4b
+Create Date: 2026-08-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4f8a9c1b'
+down_revision: Union[str, None] = '5c6a0b7b1f4b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index matching the keyset pagination predicate
+    # (document_topic_id, document_type, document_id > cursor ORDER BY
+    # document_id), so each page is a single index range scan regardless
+    # of page depth
+    op.create_index(
+        'ix_document_topic_type_id',
+        'documents',
+        ['document_topic_id', 'document_type', 'document_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_document_topic_type_id', table_name='documents')
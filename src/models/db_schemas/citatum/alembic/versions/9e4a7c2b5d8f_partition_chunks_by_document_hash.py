@@ -0,0 +1,166 @@
+"""partition_chunks_by_document_hash
+
+Revision ID: 9e4a7c2b5d8f
+Revises: 3b8c5d1e6f2a
+Create Date: 2026-08-26 11:00:00.000000
+
+Rebuilds the chunks table as a declarative hash-partitioned table on
+chunk_document_id. Every ChunkModel query filters on that column, so the
+planner prunes to a single partition: indexes shrink linearly with the
+partition count and a document delete touches one partition instead of
+the whole heap. Existing rows are copied across inside the migration's
+transaction.
+
+Trade-offs encoded here:
+- PostgreSQL requires the partition key in the primary key, so the PK
+  becomes (chunk_id, chunk_document_id). chunk_id stays globally unique
+  in practice (uuid_generate_v4) but lookups by chunk_id alone now probe
+  every partition, and no unique constraint on chunk_id alone can exist.
+- Because of that, foreign keys referencing chunks(chunk_id) - the
+  pgvector collection tables declared one - are dropped here and cannot
+  be recreated; orphan cleanup is the application's job (delete_by_ids).
+- ALTER TABLE ... RENAME does not rename the table's indexes, so the
+  parent indexes are created only after the old table (which still owns
+  the names) is dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4a7c2b5d8f'
+down_revision: Union[str, None] = '3b8c5d1e6f2a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITION_COUNT = 32
+
+
+def upgrade() -> None:
+    op.execute('ALTER TABLE chunks RENAME TO chunks_unpartitioned')
+
+    # Collection tables created by PGVectorProvider referenced
+    # chunks(chunk_id); those FKs followed the rename and would block the
+    # DROP below, and they cannot be re-pointed at the partitioned table
+    # (no unique constraint on chunk_id alone). Drop them all.
+    op.execute("""
+        DO $$
+        DECLARE
+            fk RECORD;
+        BEGIN
+            FOR fk IN
+                SELECT conrelid::regclass AS tbl, conname
+                FROM pg_constraint
+                WHERE contype = 'f'
+                  AND confrelid = 'chunks_unpartitioned'::regclass
+            LOOP
+                EXECUTE format(
+                    'ALTER TABLE %s DROP CONSTRAINT %I', fk.tbl, fk.conname
+                );
+            END LOOP;
+        END $$
+    """)
+
+    op.execute("""
+        CREATE TABLE chunks (
+            chunk_id UUID NOT NULL DEFAULT uuid_generate_v4(),
+            chunk_text TEXT NOT NULL,
+            chunk_metadata JSONB,
+            chunk_order INTEGER NOT NULL,
+            chunk_page_number INTEGER,
+            chunk_section VARCHAR,
+            chunk_topic_id UUID NOT NULL
+                REFERENCES topics (topic_id) ON DELETE CASCADE,
+            chunk_document_id UUID NOT NULL
+                REFERENCES documents (document_id) ON DELETE CASCADE,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (chunk_id, chunk_document_id)
+        ) PARTITION BY HASH (chunk_document_id)
+    """)
+
+    for i in range(PARTITION_COUNT):
+        op.execute(
+            f"CREATE TABLE chunks_p{i} PARTITION OF chunks "
+            f"FOR VALUES WITH (MODULUS {PARTITION_COUNT}, REMAINDER {i})"
+        )
+
+    op.execute("""
+        INSERT INTO chunks (
+            chunk_id, chunk_text, chunk_metadata, chunk_order,
+            chunk_page_number, chunk_section, chunk_topic_id,
+            chunk_document_id, created_at, updated_at
+        )
+        SELECT
+            chunk_id, chunk_text, chunk_metadata, chunk_order,
+            chunk_page_number, chunk_section, chunk_topic_id,
+            chunk_document_id, created_at, updated_at
+        FROM chunks_unpartitioned
+    """)
+
+    op.execute('DROP TABLE chunks_unpartitioned')
+
+    # Parent-level indexes cascade to every partition. Created only now:
+    # the old table owned these (schema-wide unique) names until the DROP
+    # above, and building them after the copy is cheaper than maintaining
+    # them through it.
+    op.create_index('ix_chunk_topic_id', 'chunks', ['chunk_topic_id'], unique=False)
+    op.create_index('ix_chunk_page_number', 'chunks', ['chunk_page_number'], unique=False)
+    op.create_index('ix_chunk_order', 'chunks', ['chunk_order'], unique=False)
+    op.create_index(
+        'ix_chunk_doc_order',
+        'chunks',
+        ['chunk_document_id', 'chunk_order', 'chunk_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    # Note: the collection-table foreign keys dropped in upgrade() are not
+    # restored; PGVectorProvider no longer declares them.
+    op.execute('ALTER TABLE chunks RENAME TO chunks_partitioned')
+
+    op.execute("""
+        CREATE TABLE chunks (
+            chunk_id UUID NOT NULL DEFAULT uuid_generate_v4(),
+            chunk_text TEXT NOT NULL,
+            chunk_metadata JSONB,
+            chunk_order INTEGER NOT NULL,
+            chunk_page_number INTEGER,
+            chunk_section VARCHAR,
+            chunk_topic_id UUID NOT NULL
+                REFERENCES topics (topic_id) ON DELETE CASCADE,
+            chunk_document_id UUID NOT NULL
+                REFERENCES documents (document_id) ON DELETE CASCADE,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITH TIME ZONE,
+            PRIMARY KEY (chunk_id)
+        )
+    """)
+
+    op.execute("""
+        INSERT INTO chunks (
+            chunk_id, chunk_text, chunk_metadata, chunk_order,
+            chunk_page_number, chunk_section, chunk_topic_id,
+            chunk_document_id, created_at, updated_at
+        )
+        SELECT
+            chunk_id, chunk_text, chunk_metadata, chunk_order,
+            chunk_page_number, chunk_section, chunk_topic_id,
+            chunk_document_id, created_at, updated_at
+        FROM chunks_partitioned
+    """)
+
+    # Dropping the partitioned parent releases the index names for the
+    # create_index calls below
+    op.execute('DROP TABLE chunks_partitioned')
+
+    op.create_index('ix_chunk_topic_id', 'chunks', ['chunk_topic_id'], unique=False)
+    op.create_index('ix_chunk_page_number', 'chunks', ['chunk_page_number'], unique=False)
+    op.create_index('ix_chunk_order', 'chunks', ['chunk_order'], unique=False)
+    op.create_index(
+        'ix_chunk_doc_order',
+        'chunks',
+        ['chunk_document_id', 'chunk_order', 'chunk_id'],
+        unique=False,
+    )
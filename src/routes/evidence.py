@@ -119,7 +119,7 @@ async def search_evidence(
             search_request.limit
         )
         
-        if results is False or not results:
+        if not results:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No evidence found for the search query"
@@ -102,16 +102,19 @@ class VectorDBInterface(ABC):
         self,
         collection_name: str,
         query_vector: List[float],
-        limit: int = 10
+        limit: int = 10,
+        min_score: Optional[float] = None
     ) -> List[dict]:
         """
         Search for similar vectors in a collection.
-        
+
         Args:
             collection_name: Name of the collection
             query_vector: Query embedding vector
             limit: Maximum number of results
-        
+            min_score: Optional similarity threshold applied by the provider
+                so below-threshold results are filtered before returning
+
         Returns:
             List of result dictionaries with text, metadata, and score
         """
@@ -1,5 +1,7 @@
 """PGVector provider for PostgreSQL with pgvector extension"""
 import asyncpg
+import csv
+import io
 from typing import List, Optional, Any
 import json
 
@@ -22,7 +24,12 @@ class PGVectorProvider(VectorDBInterface):
         """
         self.config = config
         self.connection_pool: Optional[asyncpg.Pool] = None
+        self._pool_lock: Optional[Any] = None
         self._default_vector_size = getattr(config, 'embedding_dimension', 1536)
+
+        # Pool sizing from config so deployments can match their concurrency
+        self.pool_min_size = getattr(config, 'pgvector_pool_min_size', 4)
+        self.pool_max_size = getattr(config, 'pgvector_pool_max_size', 32)
         
         # Get distance method from config (cosine, l2, inner_product)
         self.distance_method = getattr(config, 'vector_db_distance_method', 'cosine').lower()
@@ -59,31 +66,56 @@ class PGVectorProvider(VectorDBInterface):
     
     async def _get_pool(self) -> asyncpg.Pool:
         """Get or create connection pool"""
-        if self.connection_pool is None:
-            database_url = self.config.get_database_url()
-            if not database_url:
-                raise ValueError("Database URL not configured")
-            
-            # Normalize URL for asyncpg (strip SQLAlchemy driver suffix)
-            # asyncpg expects postgresql:// or postgres://, not postgresql+asyncpg://
-            if database_url.startswith('postgresql+asyncpg://'):
-                database_url = database_url.replace('postgresql+asyncpg://', 'postgresql://', 1)
-            elif database_url.startswith('postgresql+psycopg2://'):
-                database_url = database_url.replace('postgresql+psycopg2://', 'postgresql://', 1)
-            elif database_url.startswith('postgres+asyncpg://'):
-                database_url = database_url.replace('postgres+asyncpg://', 'postgres://', 1)
-            elif database_url.startswith('postgres+psycopg2://'):
-                database_url = database_url.replace('postgres+psycopg2://', 'postgres://', 1)
-            
-            self.connection_pool = await asyncpg.create_pool(
-                database_url,
-                min_size=1,
-                max_size=10
-            )
-            logger.info("Created PostgreSQL connection pool for PGVector")
-        
+        if self.connection_pool is not None:
+            return self.connection_pool
+
+        # Serialize lazy pool creation so concurrent first requests don't each
+        # open their own pool (the lock itself is created lazily because the
+        # provider is constructed before the event loop exists)
+        if self._pool_lock is None:
+            import asyncio
+            self._pool_lock = asyncio.Lock()
+
+        async with self._pool_lock:
+            if self.connection_pool is None:
+                database_url = self.config.get_database_url()
+                if not database_url:
+                    raise ValueError("Database URL not configured")
+
+                # Normalize URL for asyncpg (strip SQLAlchemy driver suffix)
+                # asyncpg expects postgresql:// or postgres://, not postgresql+asyncpg://
+                if database_url.startswith('postgresql+asyncpg://'):
+                    database_url = database_url.replace('postgresql+asyncpg://', 'postgresql://', 1)
+                elif database_url.startswith('postgresql+psycopg2://'):
+                    database_url = database_url.replace('postgresql+psycopg2://', 'postgresql://', 1)
+                elif database_url.startswith('postgres+asyncpg://'):
+                    database_url = database_url.replace('postgres+asyncpg://', 'postgres://', 1)
+                elif database_url.startswith('postgres+psycopg2://'):
+                    database_url = database_url.replace('postgres+psycopg2://', 'postgres://', 1)
+
+                self.connection_pool = await asyncpg.create_pool(
+                    database_url,
+                    min_size=self.pool_min_size,
+                    max_size=self.pool_max_size,
+                    max_inactive_connection_lifetime=300
+                )
+                logger.info(
+                    f"Created PostgreSQL connection pool for PGVector "
+                    f"(min_size={self.pool_min_size}, max_size={self.pool_max_size})"
+                )
+
         return self.connection_pool
     
+    @staticmethod
+    def _vector_literal(vector: List[float]) -> str:
+        """
+        Render a vector in pgvector text format: '[0.1,0.2,0.3]'.
+
+        Uses str() directly so integer components (e.g. int8-quantized values)
+        stay short instead of being widened to '113.0'.
+        """
+        return '[' + ','.join(map(str, vector)) + ']'
+
     def _quote_identifier(self, identifier: str) -> str:
         """
         Quote PostgreSQL identifier to handle special characters.
@@ -152,7 +184,11 @@ class PGVectorProvider(VectorDBInterface):
                     logger.info(f"Dropped existing collection: {collection_name}")
                 
                 # Create table with pgvector
-                # Foreign key references chunks table
+                # No foreign key to chunks: the partitioned chunks table has
+                # no unique constraint on chunk_id alone (the partition key
+                # is part of the PK), so such an FK cannot exist. Cleanup is
+                # handled at the application level via delete_by_ids when
+                # chunks are removed.
                 # Quote collection name to handle special characters
                 quoted_name = self._quote_identifier(collection_name)
                 create_table_sql = f"""
@@ -162,7 +198,6 @@ class PGVectorProvider(VectorDBInterface):
                         text TEXT NOT NULL,
                         metadata JSONB,
                         embedding vector({vector_size}),
-                        FOREIGN KEY (chunk_id) REFERENCES chunks(chunk_id) ON DELETE CASCADE,
                         created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
                     );
                 """
@@ -404,8 +439,7 @@ class PGVectorProvider(VectorDBInterface):
                     meta['chunk_id'] = chunk_id
                     
                     # Convert vector list to string format for pgvector
-                    # Format: '[0.1,0.2,0.3]' (no spaces, comma-separated)
-                    vector_str = '[' + ','.join(str(float(v)) for v in vector) + ']'
+                    vector_str = self._vector_literal(vector)
                     
                     values.append((
                         chunk_id,
@@ -432,11 +466,131 @@ class PGVectorProvider(VectorDBInterface):
             logger.error(f"Error inserting vectors into {collection_name}: {e}", exc_info=True)
             raise
     
+    async def insert_many_int8(
+        self,
+        collection_name: str,
+        texts: List[str],
+        metadata: List[dict],
+        vectors: List[List[int]],
+        scale: float,
+        record_ids: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Insert int8-quantized vectors into a collection.
+
+        The quantized integers are stored directly in the vector column - with
+        cosine distance the uniform scale cancels out of the similarity, so
+        search results are unchanged while the wire payload is roughly 4x
+        smaller than full-precision floats. The scale is recorded per row in
+        metadata for consumers that need to dequantize.
+
+        Args:
+            collection_name: Name of the collection
+            texts: List of text strings
+            metadata: List of metadata dictionaries
+            vectors: List of int8-quantized embedding vectors
+            scale: Quantization scale (original ~= quantized * scale)
+            record_ids: List of chunk IDs (required for PGVector)
+
+        Returns:
+            True if successful
+        """
+        if record_ids is None or len(record_ids) != len(texts):
+            raise ValueError("record_ids (chunk_ids) must be provided and match texts length")
+
+        for meta in metadata:
+            if meta is not None:
+                meta['quantization_scale'] = scale
+
+        # Integer components render far shorter than floats in the pgvector
+        # text format, which is where the bandwidth saving comes from
+        return await self.insert_many(
+            collection_name,
+            texts,
+            metadata,
+            vectors,
+            record_ids=record_ids
+        )
+
+    async def copy_insert(
+        self,
+        collection_name: str,
+        texts: List[str],
+        metadata: List[dict],
+        vectors: List[List[float]],
+        record_ids: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Bulk load vectors into a collection via COPY ... FROM STDIN.
+
+        Streams all rows in a single COPY statement instead of per-row INSERT
+        round trips, which is substantially faster for append-heavy indexing
+        (e.g. after a collection reset, where no conflicts can occur). Rows are
+        sent in CSV text format because asyncpg has no binary codec for the
+        pgvector type.
+
+        Args:
+            collection_name: Name of the collection
+            texts: List of text strings
+            metadata: List of metadata dictionaries
+            vectors: List of embedding vectors
+            record_ids: List of chunk IDs (required for PGVector)
+
+        Returns:
+            True if successful
+        """
+        if record_ids is None or len(record_ids) != len(texts):
+            raise ValueError("record_ids (chunk_ids) must be provided and match texts length")
+
+        # Ensure all input lists are aligned to avoid silent truncation by zip()
+        expected_len = len(texts)
+        if len(metadata) != expected_len:
+            raise ValueError(
+                f"Metadata length ({len(metadata)}) does not match texts length ({expected_len})"
+            )
+        if len(vectors) != expected_len:
+            raise ValueError(
+                f"Vectors length ({len(vectors)}) does not match texts length ({expected_len})"
+            )
+
+        pool = await self._get_pool()
+
+        try:
+            async with pool.acquire() as conn:
+                # Serialize all rows into one CSV payload
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                for text, meta, vector, chunk_id in zip(texts, metadata, vectors, record_ids):
+                    # Ensure metadata includes chunk_id
+                    if meta is None:
+                        meta = {}
+                    meta['chunk_id'] = chunk_id
+
+                    # Convert vector list to string format for pgvector
+                    vector_str = self._vector_literal(vector)
+
+                    writer.writerow((chunk_id, text, json.dumps(meta), vector_str))
+
+                await conn.copy_to_table(
+                    collection_name,
+                    source=io.BytesIO(buffer.getvalue().encode('utf-8')),
+                    columns=['chunk_id', 'text', 'metadata', 'embedding'],
+                    format='csv'
+                )
+
+                logger.info(f"Bulk-loaded {len(texts)} vectors into {collection_name} via COPY")
+                return True
+
+        except Exception as e:
+            logger.error(f"Error bulk-loading vectors into {collection_name}: {e}", exc_info=True)
+            raise
+
     async def search_by_vector(
         self,
         collection_name: str,
         query_vector: List[float],
-        limit: int = 10
+        limit: int = 10,
+        min_score: Optional[float] = None
     ) -> List[dict]:
         """
         Search for similar vectors in a collection using configured distance method.
@@ -445,6 +599,9 @@ class PGVectorProvider(VectorDBInterface):
             collection_name: Name of the collection
             query_vector: Query embedding vector
             limit: Maximum number of results
+            min_score: Optional similarity threshold pushed into the WHERE
+                clause so below-threshold rows are filtered in the database
+                instead of being serialized back to the application
         
         Returns:
             List of result dictionaries with text, metadata, score, and chunk_id
@@ -464,8 +621,7 @@ class PGVectorProvider(VectorDBInterface):
                 # Quote collection name to handle special characters (e.g., hyphens in UUIDs)
                 quoted_name = self._quote_identifier(collection_name)
                 # Convert query vector list to string format for pgvector
-                # Format: '[0.1,0.2,0.3]' (no spaces, comma-separated)
-                query_vector_str = '[' + ','.join(str(float(v)) for v in query_vector) + ']'
+                query_vector_str = self._vector_literal(query_vector)
                 
                 # Build query based on distance method
                 # For cosine: 1 - distance = similarity
@@ -485,6 +641,14 @@ class PGVectorProvider(VectorDBInterface):
                     score_expr = f"embedding {self.distance_operator} $1::vector"
                     order_expr = f"embedding {self.distance_operator} $1::vector DESC"
                 
+                # The distance is computed in the index scan anyway, so a
+                # threshold filters rows where they are cheapest to drop
+                where_clause = ""
+                params = [query_vector_str, limit]
+                if min_score is not None:
+                    where_clause = f"WHERE {score_expr} >= $3"
+                    params.append(min_score)
+
                 results = await conn.fetch(
                     f"""
                     SELECT 
@@ -493,11 +657,11 @@ class PGVectorProvider(VectorDBInterface):
                         metadata,
                         {score_expr} as similarity_score
                     FROM {quoted_name}
+                    {where_clause}
                     ORDER BY {order_expr}
                     LIMIT $2
                     """,
-                    query_vector_str,
-                    limit
+                    *params
                 )
                 
                 # Format results
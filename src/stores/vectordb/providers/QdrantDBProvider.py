@@ -254,7 +254,8 @@ class QdrantDBProvider(VectorDBInterface):
         self,
         collection_name: str,
         query_vector: List[float],
-        limit: int = 10
+        limit: int = 10,
+        min_score: Optional[float] = None
     ) -> List[dict]:
         """
         Search for similar vectors in a collection.
@@ -263,6 +264,9 @@ class QdrantDBProvider(VectorDBInterface):
             collection_name: Name of the collection
             query_vector: Query embedding vector
             limit: Maximum number of results
+            min_score: Optional similarity threshold applied server-side
+                (Qdrant score_threshold) so below-threshold points are never
+                returned over the wire
         
         Returns:
             List of result dictionaries with text, metadata, score, and chunk_id
@@ -273,7 +277,8 @@ class QdrantDBProvider(VectorDBInterface):
                 self.client.search,
                 collection_name=collection_name,
                 query_vector=query_vector,
-                limit=limit
+                limit=limit,
+                score_threshold=min_score
             )
             
             # Format results
@@ -148,6 +148,26 @@ class Config(BaseSettings):
         types = [t.strip() for t in self.file_allowed_types.split(",") if t.strip()]
         return types if types else ["application/pdf", "text/plain"]  # Default fallback
     
+    # PGVector Connection Pool Configuration
+    pgvector_pool_min_size: int = Field(
+        default=4,
+        description="Minimum connections kept in the PGVector pool. "
+                    "Set via PGVECTOR_POOL_MIN_SIZE environment variable."
+    )
+    pgvector_pool_max_size: int = Field(
+        default=32,
+        description="Maximum connections in the PGVector pool. "
+                    "Set via PGVECTOR_POOL_MAX_SIZE environment variable."
+    )
+
+    # Embedding Cache Configuration
+    embedding_cache_url: str = Field(
+        default="",
+        description="Redis URL for the persistent embedding cache. "
+                    "Set via EMBEDDING_CACHE_URL environment variable. "
+                    "Empty string disables the cache. Example: redis://localhost:6379/1"
+    )
+
     # Logging
     log_level: str = "INFO"
     
@@ -27,6 +27,13 @@ def create_db_session_factory(config: Config) -> Callable[[], AsyncSession]:
         pool_pre_ping=True,  # Verify connections before using
         pool_size=5,
         max_overflow=10,
+        # Keep prepared statements alive per connection so repeated
+        # statements (PK lookups, batch inserts) skip the Parse/Describe
+        # round-trip after first execution
+        connect_args={
+            "prepared_statement_cache_size": 256,
+            "statement_cache_size": 1024,
+        },
     )
     
     # Create session factory
@@ -0,0 +1,147 @@
+"""Optional Redis-backed cache for document embeddings keyed by content hash"""
+import asyncio
+import functools
+import hashlib
+from array import array
+from typing import List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - redis is an installed dependency
+    aioredis = None
+
+
+class EmbeddingCache:
+    """
+    Persistent cache of embedding vectors keyed on (model_id, blake2b(text)).
+
+    Re-indexing a topic re-embeds every chunk even when the chunk text has not
+    changed; with this cache, unchanged texts resolve to a Redis lookup instead
+    of an embedding-model call. Vectors are stored as raw float32 bytes to
+    avoid JSON overhead.
+
+    The cache is strictly best-effort: if Redis is unreachable or the URL is
+    unset, every operation degrades to a no-op and embedding proceeds normally.
+    """
+
+    def __init__(self, redis_url: str, ttl_seconds: int = 7 * 24 * 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_url: Redis connection URL; empty string disables the cache
+            ttl_seconds: Expiry for cached vectors (default: 7 days)
+        """
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self._client = None
+        self._client_loop = None
+        self._available = aioredis is not None and bool(redis_url)
+
+    @staticmethod
+    def make_key(model_id: str, text: str) -> str:
+        """Build the cache key for a (model, text) pair."""
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        return f"embedding_cache:{model_id}:{digest}"
+
+    async def _get_client(self):
+        """Get or lazily create the Redis client, or None if unavailable."""
+        if not self._available:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            # The cache instance is shared across tasks, but Celery tasks run
+            # under asyncio.run, so each task gets a fresh event loop and
+            # connections bound to the previous loop are unusable. Close the
+            # stale client (best effort - its loop may already be gone) and
+            # rebuild on the current loop.
+            stale = self._client
+            self._client = None
+            try:
+                await stale.aclose()
+            except Exception:
+                pass
+        if self._client is None:
+            try:
+                self._client = aioredis.from_url(self.redis_url)
+                self._client_loop = loop
+            except Exception as e:
+                logger.warning(f"Embedding cache unavailable, disabling: {e}")
+                self._available = False
+                return None
+        return self._client
+
+    async def close(self) -> None:
+        """Close the Redis client and its connection pool (best effort)."""
+        client = self._client
+        self._client = None
+        self._client_loop = None
+        if client is not None:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+
+    async def get_many(self, model_id: str, texts: List[str]) -> List[Optional[array]]:
+        """
+        Look up cached vectors for texts.
+
+        Returns:
+            List aligned with texts of float32 arrays; None marks a cache miss
+        """
+        client = await self._get_client()
+        if client is None or not texts:
+            return [None] * len(texts)
+
+        keys = [self.make_key(model_id, text) for text in texts]
+        try:
+            raw_values = await client.mget(keys)
+        except Exception as e:
+            logger.warning(f"Embedding cache read failed, disabling: {e}")
+            self._available = False
+            return [None] * len(texts)
+
+        vectors: List[Optional[array]] = []
+        for raw in raw_values:
+            if raw is None:
+                vectors.append(None)
+            else:
+                # Returned as a float32 array, not a list: 4 bytes per
+                # component instead of a boxed Python float per component,
+                # and every consumer only iterates or slices the vector
+                vec = array('f')
+                vec.frombytes(raw)
+                vectors.append(vec)
+        return vectors
+
+    async def set_many(self, model_id: str, texts: List[str], embeddings: List[list]) -> None:
+        """Store vectors for texts with the configured TTL (best-effort)."""
+        client = await self._get_client()
+        if client is None or not texts:
+            return
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            for text, embedding in zip(texts, embeddings):
+                key = self.make_key(model_id, text)
+                pipe.set(key, array('f', embedding).tobytes(), ex=self.ttl_seconds)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Embedding cache write failed, disabling: {e}")
+            self._available = False
+
+
+@functools.lru_cache(maxsize=8)
+def get_embedding_cache(redis_url: str, ttl_seconds: int = 7 * 24 * 3600) -> EmbeddingCache:
+    """
+    Return the shared cache instance for a Redis URL.
+
+    Controllers are constructed per request/task; sharing one EmbeddingCache
+    (and therefore one Redis connection pool) per process keeps each task
+    from opening a pool it never closes.
+    """
+    return EmbeddingCache(redis_url, ttl_seconds=ttl_seconds)